@@ -24,6 +24,8 @@ BAKE_SAMPLES = 4
 BAKE_INDEX = 1001
 BUMP_BAKE_MULTIPLIER = 2.0
 NODE_CURSOR = Vector((0, 0))
+# cycles gpu compute device types, in order of preference
+GPU_COMPUTE_DEVICE_TYPES = ["OPTIX", "CUDA", "HIP", "METAL", "ONEAPI"]
 
 def init_bake(id = 1001):
     global BAKE_INDEX
@@ -48,6 +50,61 @@ def set_cycles_samples(context, samples, adaptive_samples = -1, denoising = Fals
         context.scene.cycles.time_limit = time_limit
 
 
+def enable_cycles_gpu_devices(bake_state):
+    """Makes sure the Cycles GPU device will render on a GPU: if no GPU compute device type is set,
+       the first available one is used (OptiX preferred), and only its GPU devices are enabled.
+       The previous device preferences are stored in the bake state for post_bake to restore.
+       Returns False if there are no GPU devices to bake with."""
+
+    try:
+        cycles_prefs = bpy.context.preferences.addons["cycles"].preferences
+    except:
+        return False
+
+    if "compute_device_type" not in bake_state:
+        bake_state["compute_device_type"] = cycles_prefs.compute_device_type
+        bake_state["compute_devices"] = { device.id: device.use for device in cycles_prefs.devices }
+
+    if utils.B300():
+        cycles_prefs.refresh_devices()
+    else:
+        cycles_prefs.get_devices()
+
+    device_types = GPU_COMPUTE_DEVICE_TYPES
+    if cycles_prefs.compute_device_type in device_types:
+        # try the configured device type first
+        device_types = [cycles_prefs.compute_device_type] + device_types
+    for device_type in device_types:
+        try:
+            devices = cycles_prefs.get_devices_for_type(device_type)
+        except:
+            continue
+        gpu_devices = [ device for device in devices if device.type != "CPU" ]
+        if gpu_devices:
+            cycles_prefs.compute_device_type = device_type
+            # (cpu devices in the mix only slow the gpu down)
+            for device in devices:
+                device.use = device.type != "CPU"
+            utils.log_info(f"Baking on {device_type}: {', '.join(device.name for device in gpu_devices)}")
+            return True
+
+    utils.log_warn("No GPU compute devices available, baking on the CPU.")
+    return False
+
+
+def restore_cycles_gpu_devices(bake_state):
+    if "compute_device_type" in bake_state:
+        try:
+            cycles_prefs = bpy.context.preferences.addons["cycles"].preferences
+            cycles_prefs.compute_device_type = bake_state["compute_device_type"]
+            compute_devices = bake_state["compute_devices"]
+            for device in cycles_prefs.devices:
+                if device.id in compute_devices:
+                    device.use = compute_devices[device.id]
+        except Exception as e:
+            utils.log_error("Unable to restore the Cycles compute devices", e)
+
+
 def prep_bake(context, mat: bpy.types.Material=None, samples=BAKE_SAMPLES, image_format="PNG", make_surface=True):
     bake_state = {}
     if not context:
@@ -55,6 +112,7 @@ def prep_bake(context, mat: bpy.types.Material=None, samples=BAKE_SAMPLES, image
 
     # cycles settings
     bake_state["samples"] = context.scene.cycles.samples
+    bake_state["device"] = context.scene.cycles.device
     # Blender 3.0
     if utils.B300():
         bake_state["preview_samples"] = context.scene.cycles.preview_samples
@@ -171,6 +229,8 @@ def post_bake(context, state):
 
     # cycles settings
     context.scene.cycles.samples = state["samples"]
+    context.scene.cycles.device = state["device"]
+    restore_cycles_gpu_devices(state)
     # Blender 3.0
     if utils.B300():
         context.scene.cycles.preview_samples = state["preview_samples"]
@@ -2567,7 +2627,7 @@ def bake_character(context, chr_cache):
                            image_format=props.target_format,
                            make_surface=True)
 
-    if prefs.bake_use_gpu:
+    if prefs.bake_use_gpu and enable_cycles_gpu_devices(bake_state):
         set_cycles_samples(context, samples=props.bake_samples, adaptive_samples=0.01, use_gpu=True, denoising=False)
 
     materials_done = []
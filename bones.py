@@ -757,10 +757,10 @@ def copy_position(rig, bone, copy_bones, offset):
 def is_bone_in_collections(rig, bone: bpy.types.Bone, collections=None, groups=None, layers=None):
     if utils.B400():
         if collections:
-            for collection in collections:
-                if collection in rig.data.collections:
-                    if bone.name in rig.data.collections[collection].bones:
-                        return True
+            # test the bone's own collections, collections can be a list or a set of names
+            for bone_collection in bone.collections:
+                if bone_collection.name in collections:
+                    return True
     else:
         if groups:
             if bone.name in rig.pose.bones:
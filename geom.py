@@ -19,6 +19,7 @@ import math
 import mathutils
 from mathutils import Vector
 import bmesh
+import numpy as np
 from . import utils
 
 # Code derived from: https://blenderartists.org/t/get-3d-location-of-mesh-surface-point-from-uv-parameter/649486/2
@@ -178,6 +179,75 @@ def copy_vertex_positions_and_weights(src_obj : bpy.types.Object, dst_obj : bpy.
     dst_bm.to_mesh(dst_mesh)
 
 
+def get_mesh_loop_arrays(mesh: bpy.types.Mesh):
+    """Returns the face material index, vertex index and uv (first uv layer) of every loop of the mesh,
+       as arrays in face order."""
+
+    num_polys = len(mesh.polygons)
+    num_loops = len(mesh.loops)
+    material_indices = np.empty(num_polys, dtype=np.int32)
+    loop_totals = np.empty(num_polys, dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_indices)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    loop_verts = np.empty(num_loops, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    uvs = np.empty(num_loops * 2, dtype=np.float32)
+    mesh.uv_layers[0].data.foreach_get("uv", uvs)
+    return np.repeat(material_indices, loop_totals), loop_verts, uvs.reshape(-1, 2)
+
+
+def uv_ids(uvs, material_indices, accuracy, flatten_udim):
+    """Returns the (N,3) uv id rows of the rounded uv's and material indices."""
+
+    uvs = uvs.astype(np.float64)
+    # why flatten the udims?
+    # because the in the sculpting tools, the separate sculpting meshes
+    # must flatten the udims to bake the textures correctly
+    if flatten_udim:
+        uvs[:, 0] -= np.trunc(uvs[:, 0])
+    ids = np.empty((len(uvs), 3), dtype=np.int64)
+    ids[:, 0:2] = np.rint(uvs * (10 ** accuracy))
+    ids[:, 2] = material_indices
+    return ids
+
+
+def match_verts_by_uv_id(src_ids, src_verts, dst_ids, dst_verts, matching_vert_count):
+    """Matches the destination loops to the source loops with the same uv id and returns
+       the destination vertices and the source vertex to copy each from (the last matching loop wins).
+       UV ids shared by more than one source vertex can't be matched, so if the vertex counts
+       match, those copy from the same vertex index instead."""
+
+    # the source vertex of the last loop with each uv id and if the uv id is on more than one vertex
+    src_keys, src_inverse = np.unique(src_ids, axis=0, return_inverse=True)
+    src_inverse = src_inverse.reshape(-1)
+    num_keys = len(src_keys)
+    last = len(src_inverse) - 1 - np.unique(src_inverse[::-1], return_index=True)[1]
+    key_verts = src_verts[last]
+    min_verts = np.full(num_keys, np.iinfo(np.int64).max, dtype=np.int64)
+    max_verts = np.full(num_keys, -1, dtype=np.int64)
+    np.minimum.at(min_verts, src_inverse, src_verts)
+    np.maximum.at(max_verts, src_inverse, src_verts)
+    overlapping = min_verts != max_verts
+
+    # look up the destination uv ids in the source uv ids
+    all_keys, all_inverse = np.unique(np.concatenate((src_keys, dst_ids)), axis=0, return_inverse=True)
+    all_inverse = all_inverse.reshape(-1)
+    key_index = np.full(len(all_keys), -1, dtype=np.int64)
+    key_index[all_inverse[:num_keys]] = np.arange(num_keys)
+    dst_keys = key_index[all_inverse[num_keys:]]
+    found = dst_keys >= 0
+    dst_verts = dst_verts[found]
+    dst_keys = dst_keys[found]
+    copy_verts = key_verts[dst_keys]
+    if matching_vert_count:
+        overlapped = overlapping[dst_keys]
+        copy_verts[overlapped] = dst_verts[overlapped]
+
+    # each destination vertex copies from its last loop
+    verts, last = np.unique(dst_verts[::-1], return_index=True)
+    return verts, copy_verts[::-1][last]
+
+
 def copy_vert_positions_by_uv_id(src_obj, dst_obj, accuracy=5, vertex_group=None,
                                  threshold=0.004, shape_key_name=None, flatten_udim=False):
 
@@ -192,22 +262,10 @@ def copy_vert_positions_by_uv_id(src_obj, dst_obj, accuracy=5, vertex_group=None
     src_mesh = src_obj.data
     dst_mesh = dst_obj.data
 
-    src_bm = bmesh.new()
-    dst_bm = bmesh.new()
-
-    src_bm.from_mesh(src_mesh)
-    src_bm.faces.ensure_lookup_table()
-    src_bm.verts.ensure_lookup_table()
-
-    dst_bm.from_mesh(dst_mesh)
-    dst_bm.faces.ensure_lookup_table()
-    dst_bm.verts.ensure_lookup_table()
-
-    src_map = {}
     mat_map = {}
-    overlapping = {}
 
-    matching_vert_count = len(src_bm.verts) == len(dst_bm.verts)
+    num_src_verts = len(src_mesh.vertices)
+    matching_vert_count = num_src_verts == len(dst_mesh.vertices)
 
     for i, src_mat in enumerate(src_mesh.materials):
         for j, dst_mat in enumerate(dst_mesh.materials):
@@ -223,57 +281,46 @@ def copy_vert_positions_by_uv_id(src_obj, dst_obj, accuracy=5, vertex_group=None
     if vertex_group and vertex_group in src_obj.vertex_groups:
         vg_index = src_obj.vertex_groups[vertex_group].index
 
-    ul = src_bm.loops.layers.uv[0]
-    src_bm.verts.layers.deform.verify()
-    dl = src_bm.verts.layers.deform.active
-    face : bmesh.types.BMFace
-    loop : bmesh.types.BMLoop
-
-    for face in src_bm.faces:
-        if face.material_index in mat_map:
-            dst_material_idx = mat_map[face.material_index]
-            for loop in face.loops:
-                if vg_index >= 0:
-                    vert = src_bm.verts[loop.vert.index]
-                    weight = vert[dl][vg_index]
-                    if weight < threshold:
-                        continue
-                uv = loop[ul].uv.copy()
-                # why flatten the udims?
-                # because the in the sculpting tools, the separate sculpting meshes
-                # must flatten the udims to bake the textures correctly
-                if flatten_udim:
-                    uv.x -= int(uv.x)
-                uv_id = uv.to_tuple(accuracy), dst_material_idx
-                if uv_id in src_map and src_map[uv_id] != loop.vert.index:
-                    overlapping[uv_id] = True
-                src_map[uv_id] = loop.vert.index
-
-    ul = dst_bm.loops.layers.uv[0]
+    # source loops of the mapped materials (and in the vertex group), by uv id and destination material
+    src_materials, src_verts, src_uvs = get_mesh_loop_arrays(src_mesh)
+    material_lookup = np.full(max(len(src_mesh.materials), src_materials.max(initial=0) + 1), -1, dtype=np.int64)
+    for i, j in mat_map.items():
+        if i < len(material_lookup):
+            material_lookup[i] = j
+    src_materials = material_lookup[src_materials]
+    src_loops = src_materials >= 0
+    if vg_index >= 0:
+        src_bm = bmesh.new()
+        src_bm.from_mesh(src_mesh)
+        dl = src_bm.verts.layers.deform.verify()
+        weights = np.array([vert[dl].get(vg_index, 0.0) for vert in src_bm.verts], dtype=np.float64)
+        src_bm.free()
+        src_loops &= weights[src_verts] >= threshold
+    src_verts = src_verts[src_loops]
+    src_ids = uv_ids(src_uvs[src_loops], src_materials[src_loops], accuracy, flatten_udim)
+
+    dst_materials, dst_verts, dst_uvs = get_mesh_loop_arrays(dst_mesh)
+    dst_ids = uv_ids(dst_uvs, dst_materials, accuracy, flatten_udim)
+
+    verts, copy_verts = match_verts_by_uv_id(src_ids, src_verts, dst_ids, dst_verts, matching_vert_count)
+
+    src_co = np.empty(num_src_verts * 3, dtype=np.float32)
+    src_mesh.vertices.foreach_get("co", src_co)
+    positions = src_co.reshape(-1, 3)[copy_verts].tolist()
+
+    # write through the bmesh, so the mesh shape keys are updated with the new positions
+    dst_bm = bmesh.new()
+    dst_bm.from_mesh(dst_mesh)
+    dst_bm.verts.ensure_lookup_table()
     sl = None
     if shape_key_name:
         sl = dst_bm.verts.layers.shape.get(shape_key_name)
-    for face in dst_bm.faces:
-        for loop in face.loops:
-            uv = loop[ul].uv.copy()
-            if flatten_udim:
-                uv.x -= int(uv.x)
-            uv_id = uv.to_tuple(accuracy), face.material_index
-            # overlapping UV's can't be detected correctly so try to copy from just the index position
-            if matching_vert_count and uv_id in overlapping:
-                vert_index = loop.vert.index
-                src_pos = src_bm.verts[vert_index].co
-                if sl:
-                    loop.vert[sl] = src_pos
-                else:
-                    loop.vert.co = src_pos
-            elif uv_id in src_map:
-                src_vert = src_map[uv_id]
-                src_pos = src_bm.verts[src_vert].co
-                if sl:
-                    loop.vert[sl] = src_pos
-                else:
-                    loop.vert.co = src_pos
+    bm_verts = dst_bm.verts
+    for vert_index, src_pos in zip(verts.tolist(), positions):
+        if sl:
+            bm_verts[vert_index][sl] = src_pos
+        else:
+            bm_verts[vert_index].co = src_pos
 
     dst_bm.to_mesh(dst_mesh)
 
@@ -338,18 +385,21 @@ def copy_vert_positions_by_index(src_obj, dst_obj, vertex_group = None, threshol
 
 
 def map_image_to_vertex_weights(obj, mat, image, vertex_group, func):
+    """Sets the vertex group weights of the vertices in the material from the image (red channel) at their UVs.
+       func maps an array of image values to an array of weights."""
+
     width = image.size[0]
     height = image.size[1]
     wmo = width - 1
     hmo = height - 1
     uhw = 1 / (wmo * 2)
     vhw = 1 / (hmo * 2)
-    pixels = image.pixels[:]
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
     if vertex_group in obj.vertex_groups:
         vg = obj.vertex_groups[vertex_group]
     else:
         vg = obj.vertex_groups.new(name=vertex_group)
-    vg_index = vg.index
 
     mat_index = -1
     for i, slot in enumerate(obj.material_slots):
@@ -357,29 +407,110 @@ def map_image_to_vertex_weights(obj, mat, image, vertex_group, func):
             mat_index = i
             break
 
-    mesh = obj.data
+    mesh: bpy.types.Mesh = obj.data
+    num_polys = len(mesh.polygons)
+    num_loops = len(mesh.loops)
+    material_indices = np.empty(num_polys, dtype=np.int32)
+    loop_totals = np.empty(num_polys, dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_indices)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    loop_verts = np.empty(num_loops, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    uv_data = mesh.uv_layers[0].data
+    uvs = np.empty(num_loops * 2, dtype=np.float32)
+    uv_data.foreach_get("uv", uvs)
+    uvs = uvs.reshape(-1, 2)
+
+    # the loops of the faces with the material (the loops are stored in face order)
+    mat_loops = np.repeat(material_indices == mat_index, loop_totals)
+    # flatten the udim tiles back into the 0-1 range
+    UV = uvs[mat_loops].astype(np.float64)
+    UV -= np.trunc(UV)
+    uvs[mat_loops] = UV
+    uv_data.foreach_set("uv", uvs.ravel())
+    x = ((UV[:, 0] + uhw) * wmo).astype(np.int64)
+    y = ((UV[:, 1] + vhw) * hmo).astype(np.int64)
+    weights = np.asarray(func(pixels[x * 4 + y * width * 4]), dtype=np.float64)
+
+    # each vertex takes the weight of its last loop
+    verts = loop_verts[mat_loops]
+    unique_verts, last = np.unique(verts[::-1], return_index=True)
+    vert_weights = weights[::-1][last]
+    # add the vertices in batches of the same weight
+    unique_weights, weight_groups = np.unique(vert_weights, return_inverse=True)
+    order = np.argsort(weight_groups, kind="stable")
+    splits = np.flatnonzero(np.diff(weight_groups[order])) + 1
+    for weight, group in zip(unique_weights.tolist(), np.split(unique_verts[order], splits)):
+        vg.add(group.tolist(), weight, "REPLACE")
+
+
+def delete_material_faces(obj, material_indices):
+    """Deletes the faces (and any geometry left loose) of the material slot indices from the mesh
+       and removes the material slots left unused. Be in object mode."""
+
+    mesh: bpy.types.Mesh = obj.data
     bm = bmesh.new()
     bm.from_mesh(mesh)
-    bm.faces.ensure_lookup_table()
-    bm.verts.ensure_lookup_table()
+    faces = [ face for face in bm.faces if face.material_index in material_indices ]
+    bmesh.ops.delete(bm, geom=faces, context="FACES")
+    used_indices = { face.material_index for face in bm.faces }
+    bm.to_mesh(mesh)
+    bm.free()
+    # (popping the materials shifts down the material indices of the remaining faces)
+    for index in reversed(range(len(mesh.materials))):
+        if index not in used_indices:
+            mesh.materials.pop(index=index)
+
+
+def has_doubles(mesh: bpy.types.Mesh, dist):
+    """Returns True if the mesh may have any vertices within dist of each other (never False when it does).
+       Any two such vertices are in the same or neighbouring cells of a grid of size dist."""
+
+    num_verts = len(mesh.vertices)
+    if num_verts < 2:
+        return False
+    co = np.empty(num_verts * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    # (cells offset by 1 so the neighbouring cells are never negative)
+    cells = np.floor(co.reshape(-1, 3).astype(np.float64) / dist).astype(np.int64)
+    cells -= cells.min(axis=0) - 1
+    dims = cells.max(axis=0) + 2
+    if np.prod(dims.astype(np.float64)) >= 2**62:
+        # too spread out to pack the cells, assume the worst
+        return True
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    sorted_keys = np.sort(keys)
+    if np.any(sorted_keys[1:] == sorted_keys[:-1]):
+        return True
+    # only half of the 26 neighbouring cells need checking, the other half are checked from the other side
+    for dx, dy, dz in ((1, -1, -1), (1, -1, 0), (1, -1, 1), (1, 0, -1), (1, 0, 0), (1, 0, 1), (1, 1, -1),
+                       (1, 1, 0), (1, 1, 1), (0, 1, -1), (0, 1, 0), (0, 1, 1), (0, 0, 1)):
+        neighbour_keys = keys + ((dx * dims[1] + dy) * dims[2] + dz)
+        found = np.searchsorted(sorted_keys, neighbour_keys)
+        found[found == num_verts] = 0
+        if np.any(sorted_keys[found] == neighbour_keys):
+            return True
+    return False
 
-    ul = bm.loops.layers.uv[0]
-    bm.verts.layers.deform.verify()
-    dl = bm.verts.layers.deform.active
-    for face in bm.faces:
-        if face.material_index == mat_index:
-            for loop in face.loops:
-                uv = loop[ul].uv
-                uv.x -= int(uv.x)
-                uv.y -= int(uv.y)
-                vert = bm.verts[loop.vert.index]
-                x = int((uv.x + uhw) * wmo)
-                y = int((uv.y + vhw) * hmo)
-                pixel_value = pixels[x * 4 + y * width * 4]
-                weight = func(pixel_value)
-                vert[dl][vg_index] = weight
 
-    bm.to_mesh(mesh)
+def remove_doubles(obj, dist=0.0001):
+    """Merges the vertices of the mesh closer than dist (as the remove doubles operator,
+       without going into edit mode), skipping the BMesh entirely when there can't be any.
+       Returns the number of vertices removed. Be in object mode."""
+
+    mesh: bpy.types.Mesh = obj.data
+    if not has_doubles(mesh, dist):
+        return 0
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    num_verts = len(bm.verts)
+    targetmap = bmesh.ops.find_doubles(bm, verts=bm.verts, dist=dist)["targetmap"]
+    if targetmap:
+        bmesh.ops.weld_verts(bm, targetmap=targetmap)
+        bm.to_mesh(mesh)
+    num_removed = num_verts - len(bm.verts)
+    bm.free()
+    return num_removed
 
 
 def remove_vertex_groups_from_selected(obj, vertex_groups):
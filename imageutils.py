@@ -357,9 +357,12 @@ def get_custom_image(image_name, size, alpha=False, data=True, float=False, path
     return image
 
 
-def save_scene_image(image : bpy.types.Image, file_path, file_format = 'PNG', color_depth = '8'):
-    """To reload properly, the image must be pre-saved with image.filepath_raw = ... and image.save()"""
-    scene = bpy.data.scenes.new("RL_Save_Image_Settings_Scene")
+def save_scene_image(image : bpy.types.Image, file_path, file_format = 'PNG', color_depth = '8', scene = None):
+    """To reload properly, the image must be pre-saved with image.filepath_raw = ... and image.save()
+       Saving several images can reuse one settings scene from make_save_image_scene()."""
+    temp_scene = scene is None
+    if temp_scene:
+        scene = make_save_image_scene()
     settings = scene.render.image_settings
     settings.color_depth = color_depth
     settings.file_format = file_format
@@ -369,7 +372,12 @@ def save_scene_image(image : bpy.types.Image, file_path, file_format = 'PNG', co
     image.save_render(filepath = file_path, scene = scene)
     if image.filepath:
         image.reload()
-    bpy.data.scenes.remove(scene)
+    if temp_scene:
+        bpy.data.scenes.remove(scene)
+
+
+def make_save_image_scene():
+    return bpy.data.scenes.new("RL_Save_Image_Settings_Scene")
 
 
 def make_new_image(name, width, height, format, dir, data, has_alpha, channel_packed):
@@ -2,8 +2,19 @@ import bpy #, bpy_extras
 #import bpy_extras.view3d_utils as v3d
 import atexit
 from enum import IntEnum
-import os, socket, time, select, struct, json, copy
+import os, socket, time, selectors, struct, json, copy, threading, queue
 #import subprocess
+import numpy as np
+try:
+    # optional, much faster json (not bundled with Blender, only used if installed into Blender's python)
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    # optional, fast parser for the large json payloads when orjson is not available
+    import simdjson
+except ImportError:
+    simdjson = None
 from mathutils import Vector, Quaternion, Matrix
 from . import (importer, exporter, bones, geom, colorspace,
                world, rigging, rigutils, drivers, modifiers,
@@ -17,6 +28,7 @@ HANDSHAKE_TIMEOUT_S = 60
 KEEPALIVE_TIMEOUT_S = 300
 PING_INTERVAL_S = 120
 TIMER_INTERVAL = 1/30
+STATUS_REDRAW_INTERVAL = 0.1
 MAX_CHUNK_SIZE = 32768
 SERVER_ONLY = False
 CLIENT_ONLY = True
@@ -24,7 +36,41 @@ CHARACTER_TEMPLATE: list = None
 MAX_RECEIVE = 30
 USE_PING = False
 USE_KEEPALIVE = False
+# don't move the scene frame for every received live sequence frame, the frames are keyed from the cache
+# directly and the scene frame is set once when the sequence ends (unless syncing every frame)
+DEFERRED_FRAME_UPDATE = True
 SOCKET_TIMEOUT = 5.0
+SOCKET_BUFFER_SIZE = 1 << 20
+# receive and frame the incoming messages on a background thread,
+# the Blender timer only parses the finished messages (all bpy access stays on the main thread)
+USE_RECV_THREAD = True
+RECV_THREAD_POLL = 0.1
+# gather the message headers and payloads into one sendmsg call (not available on Windows)
+USE_SENDMSG = True
+# message header: op code, payload size
+HEADER_STRUCT = struct.Struct("!II")
+# string length prefix and counts
+LENGTH_STRUCT = struct.Struct("!I")
+# packed transform: location(3), rotation(4), scale(3)
+TRANSFORM_STRUCT = struct.Struct("!ffffffffff")
+
+# rigify bones to bake the datalink animation into
+BAKE_BONE_GROUPS = frozenset(["FK", "IK", "Special", "Root"]) #not Tweak and Extra
+BAKE_BONE_COLLECTIONS = frozenset(["Face", #"Face (Primary)", "Face (Secondary)",
+                                   "Torso", "Torso (Tweak)",
+                                   "Fingers", "Fingers (Detail)",
+                                   "Arm.L (IK)", "Arm.L (FK)", "Arm.L (Tweak)",
+                                   "Leg.L (IK)", "Leg.L (FK)", "Leg.L (Tweak)",
+                                   "Arm.R (IK)", "Arm.R (FK)", "Arm.R (Tweak)",
+                                   "Leg.R (IK)", "Leg.R (FK)", "Leg.R (Tweak)",
+                                   "Root"])
+# TODO These bones may need to have their pose reset as they are damped tracked in the rig
+BAKE_BONE_EXCLUSIONS = frozenset([
+    "thigh_ik.L", "thigh_ik.R", "thigh_parent.L", "thigh_parent.R",
+    "upper_arm_ik.L", "upper_arm_ik.R", "upper_arm_parent.L", "upper_arm_parent.R"
+])
+BAKE_BONE_LAYERS = frozenset([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,28])
+
 
 class OpCodes(IntEnum):
     NONE = 0
@@ -107,6 +153,11 @@ class LinkActor():
     alias: list = None
     shape_keys: dict = None
     ik_store: dict = None
+    datalink_rig = None
+    datalink_bone_indices: np.ndarray = None
+    pose_frame_layout: np.dtype = None
+    export_rig = None
+    export_bone_indices: list = None
 
     def __init__(self, chr_cache):
         self.chr_cache = chr_cache
@@ -138,6 +189,38 @@ class LinkActor():
             return chr_cache.get_armature()
         return None
 
+    def get_export_rig(self):
+        """The rig the pose frames are sent from and the indices of the template bones in it
+           (None for all the bones), as set when the template was encoded."""
+        if not utils.object_exists_is_armature(self.export_rig):
+            chr_cache = self.get_chr_cache()
+            if chr_cache.rigified:
+                if utils.object_exists_is_armature(chr_cache.rig_export_rig):
+                    export_rig = chr_cache.rig_export_rig
+                else:
+                    export_rig = rigging.adv_export_pair_rigs(chr_cache, link_target=True)[0]
+                bone_index = { name: i for i, name in enumerate(export_rig.pose.bones.keys()) }
+                self.export_bone_indices = [ bone_index[bone_name] for bone_name in self.bones ]
+                self.export_rig = export_rig
+            else:
+                self.export_rig = chr_cache.get_armature()
+                self.export_bone_indices = None
+        return self.export_rig, self.export_bone_indices
+
+    def get_datalink_rig(self):
+        """The datalink import rig for the current template,
+           made (or fetched) on first use and then re-used for every following pose frame."""
+        if not utils.object_exists_is_armature(self.datalink_rig):
+            self.datalink_rig = make_datalink_import_rig(self)
+            self.datalink_bone_indices = None
+            if self.datalink_rig:
+                # where the template bones are in the datalink rig's pose bones (None if in the same order)
+                pose_bone_index = { name: i for i, name in enumerate(self.datalink_rig.pose.bones.keys()) }
+                indices = [ pose_bone_index[bone_name] for bone_name in self.rig_bones ]
+                if indices != list(range(len(pose_bone_index))):
+                    self.datalink_bone_indices = np.array(indices, dtype=np.int64)
+        return self.datalink_rig
+
     def select(self):
         chr_cache = self.get_chr_cache()
         if chr_cache:
@@ -167,16 +250,16 @@ class LinkActor():
         prefs = vars.prefs()
         link_data = get_link_data()
 
-        utils.log_detail(f"Looking for LinkActor: {search_name} {link_id} {search_type}")
+        utils.log_detail("Looking for LinkActor: %s %s %s", search_name, link_id, search_type)
         actor: LinkActor = None
 
         chr_cache = props.find_character_by_link_id(link_id)
         if chr_cache:
             if not search_type or LinkActor.chr_cache_type(chr_cache) == search_type:
                 actor = LinkActor(chr_cache)
-                utils.log_detail(f"Chr found by link_id: {actor.name} / {link_id}")
+                utils.log_detail("Chr found by link_id: %s / %s", actor.name, link_id)
                 return actor
-        utils.log_detail(f"Chr not found by link_id")
+        utils.log_detail("Chr not found by link_id")
 
         # try to find the character by name if the link id finds nothing
         # character id's change after every reload in iClone/CC4 so these can change.
@@ -188,7 +271,7 @@ class LinkActor():
                     actor = LinkActor(chr_cache)
                     actor.add_alias(link_id)
                     return actor
-            utils.log_detail(f"Chr not found by name")
+            utils.log_detail("Chr not found by name")
 
         # finally if matching to any avatar, trying to find an avatar and there is only
         # one avatar in the scene, use that one avatar, otherwise use the selected avatar
@@ -265,6 +348,10 @@ class LinkActor():
 
     def set_template(self, bones, meshes, expressions, visemes, morphs):
         self.bones = bones
+        # a new template needs the datalink rig re-checked
+        self.datalink_rig = None
+        # the pose frames are sent with the template's (unmapped) counts
+        self.pose_frame_layout = pose_frame_layout(len(bones), len(meshes), len(expressions), len(visemes))
         self.meshes = meshes
         self.expressions = expressions
         self.visemes = self.remap_visemes(visemes)
@@ -376,6 +463,7 @@ class LinkData():
     sequence_start_frame: int = 0
     sequence_end_frame: int = 0
     sequence_actors: list = None
+    sequence_actor_index: dict = None
     sequence_type: str = None
     #
     preview_shape_keys: bool = True
@@ -397,7 +485,7 @@ class LinkData():
 
     def reset(self):
         self.actors = []
-        self.sequence_actors = None
+        self.set_sequence_actors(None)
         self.sequence_type = None
 
     def is_cc(self):
@@ -406,7 +494,23 @@ class LinkData():
         else:
             return False
 
+    def set_sequence_actors(self, actors):
+        """Sets the sequence actors and indexes them by link id and alias."""
+        self.sequence_actors = actors
+        self.sequence_actor_index = {}
+        if actors:
+            for actor in actors:
+                for alias in actor.alias:
+                    self.sequence_actor_index.setdefault(alias, actor)
+            # link id matches take precedence over aliases
+            for actor in actors:
+                self.sequence_actor_index[actor.get_link_id()] = actor
+
     def find_sequence_actor(self, link_id) -> LinkActor:
+        actor = self.sequence_actor_index.get(link_id) if self.sequence_actor_index else None
+        if actor and (actor.get_link_id() == link_id or link_id in actor.alias):
+            return actor
+        # link id's and aliases can change after the sequence actors are set
         for actor in self.sequence_actors:
             if actor.get_link_id() == link_id:
                 return actor
@@ -427,35 +531,106 @@ class LinkData():
 LINK_DATA = LinkData()
 
 def get_link_data():
-    global LINK_DATA
     return LINK_DATA
 
 
-def encode_from_json(json_data) -> bytearray:
-    json_string = json.dumps(json_data)
-    json_bytes = bytearray(json_string, "utf-8")
+# compact separators and no circular reference check: the payloads are plain dicts and lists
+JSON_ENCODER = json.JSONEncoder(check_circular=False, separators=(",", ":"))
+# payloads at least this size (character templates, lights) are parsed with simdjson when available
+SIMDJSON_MIN_SIZE = 65536
+SIMDJSON_PARSER = None
+
+
+def encode_from_json(json_data) -> bytes:
+    if orjson:
+        # (non str keys are converted like the stdlib json does, numpy values are serialized directly)
+        return orjson.dumps(json_data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    json_string = JSON_ENCODER.encode(json_data)
+    json_bytes = json_string.encode("utf-8")
     return json_bytes
 
 
 def decode_to_json(data) -> dict:
-    text = data.decode("utf-8")
-    json_data = json.loads(text)
+    global SIMDJSON_PARSER
+    # decode straight from the received bytes or memoryview of the receive buffer
+    if orjson:
+        return orjson.loads(data)
+    if simdjson and len(data) >= SIMDJSON_MIN_SIZE:
+        # the parser reuses its internal buffers between parses
+        if not SIMDJSON_PARSER:
+            SIMDJSON_PARSER = simdjson.Parser()
+        return SIMDJSON_PARSER.parse(bytes(data), True)
+    json_data = json.loads(str(data, "utf-8"))
     return json_data
 
 
 def pack_string(s) -> bytearray:
     buffer = bytearray()
-    buffer += struct.pack("!I", len(s))
-    buffer += bytes(s, encoding="utf-8")
+    pack_string_into(buffer, 0, s)
     return buffer
 
 
+def pack_string_into(buffer: bytearray, offset, s):
+    """Packs the length prefixed utf-8 string into the buffer at offset, growing the buffer if needed.
+       Returns the offset after the string."""
+    string = bytes(s, encoding="utf-8")
+    length = len(string)
+    end = offset + 4 + length
+    if end > len(buffer):
+        buffer.extend(bytes(end - len(buffer)))
+    LENGTH_STRUCT.pack_into(buffer, offset, length)
+    buffer[offset+4:end] = string
+    return end
+
+
 def unpack_string(buffer, offset=0):
-    length = struct.unpack_from("!I", buffer, offset)[0]
-    offset += 4
-    string: bytearray = buffer[offset:offset+length]
+    length = LENGTH_STRUCT.unpack_from(buffer, offset)[0]
+    offset += LENGTH_STRUCT.size
+    string = str(buffer[offset:offset+length], "utf-8")
     offset += length
-    return offset, string.decode(encoding="utf-8")
+    return offset, string
+
+
+def unpack_floats(buffer, count, offset=0):
+    """Unpacks count big-endian float32 values in one go, as a (native) float64 array."""
+    values = np.frombuffer(buffer, dtype=">f4", count=count, offset=offset).astype(np.float64)
+    offset += count * 4
+    return offset, values
+
+
+def pose_frame_layout(num_bones, num_meshes, num_expressions, num_visemes):
+    """The (big-endian) layout of an actor's bone, mesh, expression and viseme blocks in a pose frame,
+       for unpacking all of them with a single np.frombuffer once the template is known."""
+    return np.dtype([("num_bones", ">u4"), ("bones", ">f4", (num_bones, 10)),
+                     ("num_meshes", ">u4"), ("meshes", ">f4", (num_meshes, 10)),
+                     ("num_expressions", ">u4"), ("expressions", ">f4", (num_expressions,)),
+                     ("num_visemes", ">u4"), ("visemes", ">f4", (num_visemes,))])
+
+
+def unpack_pose_frame_blocks(buffer, offset=0, layout: np.dtype = None):
+    """Unpacks an actor's bone and mesh transforms (N,10) and expression and viseme weights
+       from a pose frame. Reads them in one go with the template layout if the block counts match it."""
+    if layout is not None and offset + layout.itemsize <= len(buffer):
+        blocks = np.frombuffer(buffer, dtype=layout, count=1, offset=offset)[0]
+        if (blocks["num_bones"] == layout["bones"].shape[0] and
+            blocks["num_meshes"] == layout["meshes"].shape[0] and
+            blocks["num_expressions"] == layout["expressions"].shape[0] and
+            blocks["num_visemes"] == layout["visemes"].shape[0]):
+            return (offset + layout.itemsize,
+                    blocks["bones"].astype(np.float64),
+                    blocks["meshes"].astype(np.float64),
+                    blocks["expressions"].astype(np.float64),
+                    blocks["visemes"].astype(np.float64))
+    # unknown or changed layout: unpack block by block
+    num_bones = LENGTH_STRUCT.unpack_from(buffer, offset)[0]
+    offset, bone_data = unpack_floats(buffer, num_bones * 10, offset + LENGTH_STRUCT.size)
+    num_meshes = LENGTH_STRUCT.unpack_from(buffer, offset)[0]
+    offset, mesh_data = unpack_floats(buffer, num_meshes * 10, offset + LENGTH_STRUCT.size)
+    num_expressions = LENGTH_STRUCT.unpack_from(buffer, offset)[0]
+    offset, expression_weights = unpack_floats(buffer, num_expressions, offset + LENGTH_STRUCT.size)
+    num_visemes = LENGTH_STRUCT.unpack_from(buffer, offset)[0]
+    offset, viseme_weights = unpack_floats(buffer, num_visemes, offset + LENGTH_STRUCT.size)
+    return offset, bone_data.reshape(-1, 10), mesh_data.reshape(-1, 10), expression_weights, viseme_weights
 
 
 def get_local_data_path():
@@ -492,6 +667,15 @@ def RLFA(f):
     return f + 1
 
 
+def set_quaternion_rotation_mode(rig):
+    """The pose frames are written straight into rotation_quaternion (set_pose_bone_transforms),
+       so every pose bone of the datalink rig must be in quaternion rotation mode."""
+    if utils.object_exists_is_armature(rig):
+        for pose_bone in rig.pose.bones:
+            if pose_bone.rotation_mode != "QUATERNION":
+                pose_bone.rotation_mode = "QUATERNION"
+
+
 def make_datalink_import_rig(actor: LinkActor):
     """Creates or re-uses and existing datalink pose rig for the character.
        This uses a pre-generated character template (list of bones in the character)
@@ -516,6 +700,7 @@ def make_datalink_import_rig(actor: LinkActor):
         actor.rig_bones = actor.bones.copy()
         utils.unhide(chr_cache.rig_datalink_rig)
         #utils.log_info(f"Using existing datalink transfer rig: {chr_cache.rig_datalink_rig.name}")
+        set_quaternion_rotation_mode(chr_cache.rig_datalink_rig)
         return chr_cache.rig_datalink_rig
 
     no_constraints = True if chr_cache.rigified else False
@@ -556,6 +741,7 @@ def make_datalink_import_rig(actor: LinkActor):
                     utils.log_warn(f"Could not find bone: {rig_bone_name} in character rig!")
         utils.safe_set_action(datalink_rig, None)
 
+    set_quaternion_rotation_mode(datalink_rig)
     utils.object_mode_to(datalink_rig)
     utils.hide(datalink_rig)
 
@@ -598,54 +784,55 @@ def remove_datalink_import_rig(actor: LinkActor):
 
             utils.delete_armature_object(chr_cache.rig_datalink_rig)
             chr_cache.rig_datalink_rig = None
+            actor.datalink_rig = None
 
         #rigging.reset_shape_keys(chr_cache)
         utils.object_mode_to(chr_rig)
 
 
-def set_actor_expression_weight(objects, expression_name, weight):
-    global LINK_DATA
-    if objects and LINK_DATA.preview_shape_keys:
-        obj: bpy.types.Object
+def get_shape_key_targets(objects, key_names):
+    """For each shape key name, the list of matching key blocks in the objects."""
+    targets = []
+    for key_name in key_names:
+        key_blocks = []
         for obj in objects:
-            if expression_name in obj.data.shape_keys.key_blocks:
-                if obj.data.shape_keys.key_blocks[expression_name].value != weight:
-                    obj.data.shape_keys.key_blocks[expression_name].value = weight
+            if obj.data.shape_keys and obj.data.shape_keys.key_blocks:
+                if key_name in obj.data.shape_keys.key_blocks:
+                    key_blocks.append(obj.data.shape_keys.key_blocks[key_name])
+        targets.append(key_blocks)
+    return targets
 
 
-def set_actor_viseme_weight(objects, viseme_name, weight):
-    global LINK_DATA
-    if objects and LINK_DATA.preview_shape_keys:
-        for obj in objects:
-            if obj.data.shape_keys and obj.data.shape_keys.key_blocks:
-                if viseme_name in obj.data.shape_keys.key_blocks:
-                    if obj.data.shape_keys.key_blocks[viseme_name].value != weight:
-                        obj.data.shape_keys.key_blocks[viseme_name].value = weight
+def set_shape_key_target_weight(key_blocks, weight):
+    for key_block in key_blocks:
+        if key_block.value != weight:
+            key_block.value = weight
 
 
 def ensure_current_frame(current_frame):
-    if bpy.context.scene.frame_current != current_frame:
-        bpy.context.scene.frame_current = current_frame
+    scene = bpy.context.scene
+    if scene.frame_current != current_frame:
+        scene.frame_current = current_frame
     return current_frame
 
 
 def next_frame(current_frame=None):
+    scene = bpy.context.scene
     if current_frame is None:
-        current_frame = bpy.context.scene.frame_current
-    fps = bpy.context.scene.render.fps
-    end_frame = bpy.context.scene.frame_end
+        current_frame = scene.frame_current
+    end_frame = scene.frame_end
     current_frame = min(end_frame, current_frame + 1)
-    bpy.context.scene.frame_current = current_frame
+    scene.frame_current = current_frame
     return current_frame
 
 
 def prev_frame(current_frame=None):
+    scene = bpy.context.scene
     if current_frame is None:
-        current_frame = bpy.context.scene.frame_current
-    fps = bpy.context.scene.render.fps
-    start_frame = bpy.context.scene.frame_start
+        current_frame = scene.frame_current
+    start_frame = scene.frame_start
     current_frame = max(start_frame, current_frame - 1)
-    bpy.context.scene.frame_current = current_frame
+    scene.frame_current = current_frame
     return current_frame
 
 
@@ -657,20 +844,32 @@ def reset_action(chr_cache):
             utils.clear_prop_collection(action.fcurves)
 
 
-def create_fcurves_cache(count, indices, defaults):
+def create_fcurves_cache(count, indices, defaults, start_frame=0):
     curves = []
     cache = {
         "count": count,
         "indices": indices,
         "curves": curves,
     }
+    # frames are fixed per index, so only the values need writing when storing the keyframes
+    frames = np.arange(start_frame, start_frame + count, dtype=np.float32)
     for i in range(0, indices):
-        d = defaults[i]
-        cache_data = [d]*(count*2)
+        cache_data = np.empty(count*2, dtype=np.float32)
+        cache_data[0::2] = frames
+        cache_data[1::2] = defaults[i]
         curves.append(cache_data)
     return cache
 
 
+def create_bone_curves_cache(count, num_bones, start_frame=0):
+    """One contiguous (bones, 10, count*2) array of interleaved frame/value keyframes for all the cached bones,
+       the 10 curves per bone being location(3), scale(3) and rotation quaternion(4)."""
+    curves = np.empty((num_bones, 10, count*2), dtype=np.float32)
+    curves[:, :, 0::2] = np.arange(start_frame, start_frame + count, dtype=np.float32)
+    curves[:, :, 1::2] = np.array([0,0,0, 1,1,1, 1,0,0,0], dtype=np.float32)[:, None]
+    return curves
+
+
 def get_datalink_rig_action(rig, motion_id=None):
     if not motion_id:
         motion_id = "DataLink"
@@ -735,21 +934,6 @@ def prep_rig(actor: LinkActor, start_frame, end_frame):
             if chr_cache.rigified:
                 # disable IK stretch
                 actor.ik_store = rigutils.disable_ik_stretch(rig)
-                BAKE_BONE_GROUPS = ["FK", "IK", "Special", "Root"] #not Tweak and Extra
-                BAKE_BONE_COLLECTIONS = ["Face", #"Face (Primary)", "Face (Secondary)",
-                                         "Torso", "Torso (Tweak)",
-                                         "Fingers", "Fingers (Detail)",
-                                         "Arm.L (IK)", "Arm.L (FK)", "Arm.L (Tweak)",
-                                         "Leg.L (IK)", "Leg.L (FK)", "Leg.L (Tweak)",
-                                         "Arm.R (IK)", "Arm.R (FK)", "Arm.R (Tweak)",
-                                         "Leg.R (IK)", "Leg.R (FK)", "Leg.R (Tweak)",
-                                         "Root"]
-                # TODO These bones may need to have their pose reset as they are damped tracked in the rig
-                BAKE_BONE_EXCLUSIONS = [
-                    "thigh_ik.L", "thigh_ik.R", "thigh_parent.L", "thigh_parent.R",
-                    "upper_arm_ik.L", "upper_arm_ik.R", "upper_arm_parent.L", "upper_arm_parent.R"
-                ]
-                BAKE_BONE_LAYERS = [0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,28]
                 if utils.object_mode_to(rig):
                     bone: bpy.types.Bone
                     pose_bone: bpy.types.PoseBone
@@ -778,51 +962,109 @@ def prep_rig(actor: LinkActor, start_frame, end_frame):
             # create keyframe cache for animation sequences
             count = end_frame - start_frame + 1
             bone_cache = {}
+            pose_bone_cache = {}
             expression_cache = {}
             viseme_cache = {}
             morph_cache = {}
             actor_cache = {
                 "rig": rig,
                 "bones": bone_cache,
+                "pose_bones": pose_bone_cache,
                 "expressions": expression_cache,
                 "visemes": viseme_cache,
                 "morphs": morph_cache,
                 "start": start_frame,
                 "end": end_frame,
             }
+            # bone matrix arrays for batch evaluating the cached bones each frame
+            pose_bone_indices = { pose_bone.name: i for i, pose_bone in enumerate(rig.pose.bones) }
+            cache_bone_indices = []
+            cache_parent_indices = []
+            rest_inverse_parent_rest = []
+            use_local_location = []
+            use_inherit_rotation = []
             for pose_bone in rig.pose.bones:
                 bone_name = pose_bone.name
-                bone = rig.data.bones[bone_name]
+                bone = pose_bone.bone
                 if bone.select:
-                    loc_cache = create_fcurves_cache(count, 3, [0,0,0])
-                    sca_cache = create_fcurves_cache(count, 3, [1,1,1])
-                    rot_cache = create_fcurves_cache(count, 4, [1,0,0,0])
-                    bone_cache[bone_name] = {
-                        "loc": loc_cache,
-                        "sca": sca_cache,
-                        "rot": rot_cache,
-                    }
+                    # index into the bone curves cache
+                    bone_cache[bone_name] = len(bone_cache)
+                    pose_bone_cache[bone_name] = pose_bone
+                    cache_bone_indices.append(pose_bone_indices[bone_name])
+                    # the rest pose doesn't change during the sequence, so precompute
+                    # the bone rest inverse and its product with the parent rest pose
+                    RI: Matrix = bone.matrix_local.inverted()
+                    if pose_bone.parent:
+                        cache_parent_indices.append(pose_bone_indices[pose_bone.parent.name])
+                        rest_inverse_parent_rest.append(np.array(RI @ pose_bone.parent.bone.matrix_local))
+                    else:
+                        cache_parent_indices.append(-1)
+                        rest_inverse_parent_rest.append(np.array(RI))
+                    use_local_location.append(bone.use_local_location)
+                    use_inherit_rotation.append(bone.use_inherit_rotation)
+            parent_indices = np.array(cache_parent_indices, dtype=np.int32)
+            has_parent = parent_indices >= 0
+            num_pose_bones = len(rig.pose.bones)
+            num_cache_bones = len(cache_bone_indices)
+            actor_cache["bone_curves"] = create_bone_curves_cache(count, num_cache_bones, start_frame)
+            actor_cache["matrices"] = {
+                # flat buffer for all the pose bone matrices of the rig
+                "pose": np.empty(num_pose_bones * 16, dtype=np.float32),
+                "bones": np.array(cache_bone_indices, dtype=np.int32),
+                # cached bones with parents and the pose bone indices of those parents
+                "child_bones": np.flatnonzero(has_parent),
+                "parents": parent_indices[has_parent],
+                "rest_inverse_parent_rest": np.array(rest_inverse_parent_rest, dtype=np.float64).reshape(-1, 4, 4),
+                "local_location": np.array(use_local_location, dtype=bool)[:, None],
+                "inherit_rotation": np.array(use_inherit_rotation, dtype=bool)[:, None, None],
+                # preallocated work buffers for decompose_bone_matrices
+                "O": np.empty((num_pose_bones, 4, 4), dtype=np.float64),
+                "M": np.empty((num_cache_bones, 4, 4), dtype=np.float64),
+                "NL": np.empty((num_cache_bones, 4, 4), dtype=np.float64),
+                "L": np.empty((num_cache_bones, 4, 4), dtype=np.float64),
+                "values": np.empty((num_cache_bones, 10), dtype=np.float64),
+            }
 
             for expression_name in actor.expressions:
-                expression_cache[expression_name] = create_fcurves_cache(count, 1, [0])
+                expression_cache[expression_name] = create_fcurves_cache(count, 1, [0], start_frame)
 
             for viseme_name in actor.visemes:
-                viseme_cache[viseme_name] = create_fcurves_cache(count, 1, [0])
+                viseme_cache[viseme_name] = create_fcurves_cache(count, 1, [0], start_frame)
 
             for morph_name in actor.morphs:
                 pass
 
+            # shape key targets for previewing the expression and viseme weights
+            actor_cache["expression_targets"] = get_shape_key_targets(objects, actor.expressions)
+            actor_cache["viseme_targets"] = get_shape_key_targets(objects, actor.visemes)
+
             actor.set_cache(actor_cache)
 
 
 def set_frame_range(start, end):
-    bpy.data.scenes["Scene"].frame_start = start
-    bpy.data.scenes["Scene"].frame_end = end
+    scene = bpy.data.scenes["Scene"]
+    scene.frame_start = start
+    scene.frame_end = end
 
 
-def set_frame(frame):
+def set_frame(frame, update=True):
     bpy.data.scenes["Scene"].frame_current = frame
-    bpy.context.view_layer.update()
+    # (skip the evaluation when the next pose frame will re-evaluate the scene anyway)
+    if update:
+        bpy.context.view_layer.update()
+
+
+def run_deferred(func, *args):
+    """Runs func(*args) from a one shot timer, so the service loop returns and keeps draining the socket first."""
+
+    def deferred():
+        try:
+            func(*args)
+        except Exception as e:
+            utils.log_error(f"Error running deferred {func.__name__}", e)
+        return None
+
+    bpy.app.timers.register(deferred, first_interval=0.0)
 
 
 def key_frame_pose_visual():
@@ -831,6 +1073,148 @@ def key_frame_pose_visual():
         bpy.ops.anim.keyframe_insert_menu(type='BUILTIN_KSI_VisualLocRot')
 
 
+def matrices_to_quaternions(M):
+    """Converts an (N,3,3) array of rotation(+scale) matrices into an (N,4) array of (w,x,y,z) quaternions.
+       Follows the same branching as mathutils Matrix.to_quaternion() so the results match."""
+
+    # normalize the matrix columns (remove scale)
+    M = M / np.maximum(np.linalg.norm(M, axis=1, keepdims=True), 1e-30)
+    # negative matrices are negated first
+    M = np.where((np.linalg.det(M) < 0)[:, None, None], -M, M)
+    m00 = M[:, 0, 0]
+    m11 = M[:, 1, 1]
+    m22 = M[:, 2, 2]
+    m01 = M[:, 0, 1]
+    m10 = M[:, 1, 0]
+    m02 = M[:, 0, 2]
+    m20 = M[:, 2, 0]
+    m12 = M[:, 1, 2]
+    m21 = M[:, 2, 1]
+    Q = np.empty((len(M), 4), dtype=np.float64)
+    # Shepperd's method: pick the largest diagonal term for the most stable result
+    X = (m22 < 0) & (m00 > m11)
+    Y = (m22 < 0) & ~X
+    Z = (m22 >= 0) & (m00 < -m11)
+    W = (m22 >= 0) & ~Z
+    if X.any():
+        s = 2.0 * np.sqrt(np.maximum(1.0 + m00[X] - m11[X] - m22[X], 0.0))
+        s = np.where(m21[X] < m12[X], -s, s)
+        Q[X, 1] = 0.25 * s
+        s = 1.0 / s
+        Q[X, 0] = (m21[X] - m12[X]) * s
+        Q[X, 2] = (m10[X] + m01[X]) * s
+        Q[X, 3] = (m02[X] + m20[X]) * s
+    if Y.any():
+        s = 2.0 * np.sqrt(np.maximum(1.0 - m00[Y] + m11[Y] - m22[Y], 0.0))
+        s = np.where(m02[Y] < m20[Y], -s, s)
+        Q[Y, 2] = 0.25 * s
+        s = 1.0 / s
+        Q[Y, 0] = (m02[Y] - m20[Y]) * s
+        Q[Y, 1] = (m10[Y] + m01[Y]) * s
+        Q[Y, 3] = (m21[Y] + m12[Y]) * s
+    if Z.any():
+        s = 2.0 * np.sqrt(np.maximum(1.0 - m00[Z] - m11[Z] + m22[Z], 0.0))
+        s = np.where(m10[Z] < m01[Z], -s, s)
+        Q[Z, 3] = 0.25 * s
+        s = 1.0 / s
+        Q[Z, 0] = (m10[Z] - m01[Z]) * s
+        Q[Z, 1] = (m02[Z] + m20[Z]) * s
+        Q[Z, 2] = (m21[Z] + m12[Z]) * s
+    if W.any():
+        s = 2.0 * np.sqrt(np.maximum(1.0 + m00[W] + m11[W] + m22[W], 0.0))
+        Q[W, 0] = 0.25 * s
+        s = 1.0 / np.maximum(s, 1e-30)
+        Q[W, 1] = (m21[W] - m12[W]) * s
+        Q[W, 2] = (m02[W] - m20[W]) * s
+        Q[W, 3] = (m10[W] - m01[W]) * s
+    Q /= np.maximum(np.linalg.norm(Q, axis=1, keepdims=True), 1e-30)
+    return Q
+
+
+def decompose_bone_matrices(matrices):
+    """Evaluates the local location, scale and rotation of the cached bones from the pose bone matrices
+       in matrices["pose"], into matrices["values"] as (N,10) rows of loc(3), sca(3), rot(4)."""
+
+    O = matrices["O"]
+    M = matrices["M"]
+    NL = matrices["NL"]
+    L = matrices["L"]
+    values = matrices["values"]
+    # object space matrices of all the pose bones after contraints and drivers
+    # (foreach_get fills column major, transpose to row major)
+    np.copyto(O, matrices["pose"].reshape(-1, 4, 4).transpose(0, 2, 1))
+    np.take(O, matrices["bones"], axis=0, out=M)
+    # non-local space matrices (if not using local location or inherit rotation): PI @ M
+    np.copyto(NL, M)
+    child_bones = matrices["child_bones"]
+    if len(child_bones):
+        # parent object space matrices inverted
+        PI = np.linalg.inv(O[matrices["parents"]])
+        NL[child_bones] = PI @ M[child_bones]
+    # local space matrices: RI @ (PR @ (PI @ M))
+    np.matmul(matrices["rest_inverse_parent_rest"], NL, out=L)
+    values[:, 0:3] = np.where(matrices["local_location"], L[:, :3, 3], NL[:, :3, 3])
+    values[:, 3:6] = np.linalg.norm(L[:, :3, :3], axis=1)
+    values[:, 6:10] = matrices_to_quaternions(np.where(matrices["inherit_rotation"],
+                                                       L[:, :3, :3], NL[:, :3, :3]))
+    return values
+
+
+def pack_pose_bone_transforms(rig, M: Matrix, bone_indices=None, translation_scale=1.0):
+    """Packs the M transformed pose bone matrices of the rig (or just the bones at bone_indices)
+       as big-endian float32 rows of loc(3), rot(4) x,y,z,w, sca(3), all in one batch."""
+
+    pose = np.empty(len(rig.pose.bones) * 16, dtype=np.float32)
+    rig.pose.bones.foreach_get("matrix", pose)
+    # (foreach_get fills column major, transpose to row major)
+    B = pose.reshape(-1, 4, 4).transpose(0, 2, 1)
+    if bone_indices is not None:
+        B = B[bone_indices]
+    T = np.array(M, dtype=np.float32) @ B
+    R = T[:, :3, :3]
+    Q = matrices_to_quaternions(R)
+    bone_data = np.empty((len(T), 10), dtype=">f4")
+    bone_data[:, 0:3] = T[:, :3, 3] * translation_scale
+    bone_data[:, 3:6] = Q[:, 1:4]
+    bone_data[:, 6] = Q[:, 0]
+    bone_data[:, 7:10] = np.linalg.norm(R, axis=1)
+    return bone_data.tobytes()
+
+
+def set_pose_bone_transforms(rig, bone_indices, bone_data):
+    """Writes the (N,10) rows of loc(3), rot(4) x,y,z,w, sca(3) from a pose frame into the rig's pose bones
+       (at bone_indices, or in order if None) with one foreach_set per property."""
+
+    pose_bones = rig.pose.bones
+    num_pose_bones = len(pose_bones)
+    location = np.empty((num_pose_bones, 3), dtype=np.float32)
+    rotation = np.empty((num_pose_bones, 4), dtype=np.float32)
+    scale = np.empty((num_pose_bones, 3), dtype=np.float32)
+    if bone_indices is None and len(bone_data) == num_pose_bones:
+        location[:] = bone_data[:, 0:3] * 0.01
+        rotation[:] = bone_data[:, (6, 3, 4, 5)]
+        scale[:] = bone_data[:, 7:10]
+    else:
+        # only some of the pose bones are in the frame, keep the rest as they are
+        pose_bones.foreach_get("location", location.ravel())
+        pose_bones.foreach_get("rotation_quaternion", rotation.ravel())
+        pose_bones.foreach_get("scale", scale.ravel())
+        if bone_indices is None:
+            bone_indices = np.arange(min(len(bone_data), num_pose_bones))
+        num = min(len(bone_indices), len(bone_data))
+        bone_indices = bone_indices[:num]
+        bone_data = bone_data[:num]
+        location[bone_indices] = bone_data[:, 0:3] * 0.01
+        rotation[bone_indices] = bone_data[:, (6, 3, 4, 5)]
+        scale[bone_indices] = bone_data[:, 7:10]
+    # (setting rotation_quaternion doesn't need the rotation mode switched)
+    pose_bones.foreach_set("location", location.ravel())
+    pose_bones.foreach_set("rotation_quaternion", rotation.ravel())
+    pose_bones.foreach_set("scale", scale.ravel())
+    # foreach_set doesn't tag the rig for re-evaluation
+    rig.update_tag()
+
+
 def store_bone_cache_keyframes(actor: LinkActor, frame):
     """Needs to be called after all constraints have been set and all bones in the pose positioned"""
 
@@ -842,45 +1226,13 @@ def store_bone_cache_keyframes(actor: LinkActor, frame):
     start_frame = actor.cache["start"]
     cache_index = (frame - start_frame) * 2
     bone_cache = actor.cache["bones"]
-    for bone_name in bone_cache:
-        loc_cache = bone_cache[bone_name]["loc"]
-        sca_cache = bone_cache[bone_name]["sca"]
-        rot_cache = bone_cache[bone_name]["rot"]
-        pose_bone: bpy.types.PoseBone = rig.pose.bones[bone_name]
-        L: Matrix   # local space matrix we want
-        NL: Matrix  # non-local space matrix we want (if not using local location or inherit rotation)
-        M: Matrix = pose_bone.matrix # object space matrix of the pose bone after contraints and drivers
-        R: Matrix = pose_bone.bone.matrix_local # bone rest pose matrix
-        RI: Matrix = R.inverted() # bone rest pose matrix inverted
-        if pose_bone.parent:
-            PI: Matrix = pose_bone.parent.matrix.inverted() # parent object space matrix inverted (after contraints and drivers)
-            PR: Matrix = pose_bone.parent.bone.matrix_local # parent rest pose matrix
-            L = RI @ (PR @ (PI @ M))
-            NL = PI @ M
-        else:
-            L = RI @ M
-            NL = M
-        if not pose_bone.bone.use_local_location:
-            loc = NL.to_translation()
-        else:
-            loc = L.to_translation()
-        sca = L.to_scale()
-        if not pose_bone.bone.use_inherit_rotation:
-            rot = NL.to_quaternion()
-        else:
-            rot = L.to_quaternion()
-        for i in range(0, 3):
-            curve = loc_cache["curves"][i]
-            curve[cache_index] = frame
-            curve[cache_index + 1] = loc[i]
-        for i in range(0, 3):
-            curve = sca_cache["curves"][i]
-            curve[cache_index] = frame
-            curve[cache_index + 1] = sca[i]
-        for i in range(0, 4):
-            curve = rot_cache["curves"][i]
-            curve[cache_index] = frame
-            curve[cache_index + 1] = rot[i]
+    if not bone_cache:
+        return
+    matrices = actor.cache["matrices"]
+    rig.pose.bones.foreach_get("matrix", matrices["pose"])
+    values = decompose_bone_matrices(matrices)
+    # frames are prefilled in the cache, only the values are written
+    actor.cache["bone_curves"][:, :, cache_index + 1] = values
 
 
 def store_shape_key_cache_keyframes(actor: LinkActor, frame, expression_weights, viseme_weights, morph_weights):
@@ -889,19 +1241,22 @@ def store_shape_key_cache_keyframes(actor: LinkActor, frame, expression_weights,
         return
 
     start_frame = actor.cache["start"]
-    cache_index = (frame - start_frame) * 2
+    value_index = (frame - start_frame) * 2 + 1
 
     expression_cache = actor.cache["expressions"]
     for i, expression_name in enumerate(expression_cache):
-        curve = expression_cache[expression_name]["curves"][0]
-        curve[cache_index] = frame
-        curve[cache_index + 1] = expression_weights[i]
+        expression_cache[expression_name]["curves"][0][value_index] = expression_weights[i]
 
     viseme_cache = actor.cache["visemes"]
     for i, viseme_name in enumerate(viseme_cache):
-        curve = viseme_cache[viseme_name]["curves"][0]
-        curve[cache_index] = frame
-        curve[cache_index + 1] = viseme_weights[i]
+        viseme_cache[viseme_name]["curves"][0][value_index] = viseme_weights[i]
+
+
+def add_fcurve_keys(fcurves, data_path, index, action_group, num_frames, co):
+    """Adds a new fcurve with all num_frames keyframes set in one foreach_set from the flat frame, value array."""
+    fcurve: bpy.types.FCurve = fcurves.new(data_path, index=index, action_group=action_group)
+    fcurve.keyframe_points.add(num_frames)
+    fcurve.keyframe_points.foreach_set('co', co)
 
 
 def write_sequence_actions(actor: LinkActor, num_frames):
@@ -912,52 +1267,41 @@ def write_sequence_actions(actor: LinkActor, num_frames):
         set_count = num_frames * 2
 
         if rig_action:
-            utils.clear_prop_collection(rig_action.fcurves)
+            fcurves = rig_action.fcurves
+            utils.clear_prop_collection(fcurves)
             bone_cache = actor.cache["bones"]
-            for bone_name in bone_cache:
-                pose_bone: bpy.types.PoseBone = rig.pose.bones[bone_name]
-                loc_cache = bone_cache[bone_name]["loc"]
-                sca_cache = bone_cache[bone_name]["sca"]
-                rot_cache = bone_cache[bone_name]["rot"]
-                fcurve: bpy.types.FCurve
+            pose_bone_cache = actor.cache["pose_bones"]
+            # (each row of the curves cache is a contiguous float32 frame, value array)
+            bone_curves = actor.cache["bone_curves"][:, :, :set_count]
+            for bone_name, bone_index in bone_cache.items():
+                pose_bone: bpy.types.PoseBone = pose_bone_cache[bone_name]
+                curves = bone_curves[bone_index]
+                loc_path = pose_bone.path_from_id("location")
+                sca_path = pose_bone.path_from_id("scale")
+                rot_path = pose_bone.path_from_id("rotation_quaternion")
                 for i in range(0, 3):
-                    data_path = pose_bone.path_from_id("location")
-                    fcurve = rig_action.fcurves.new(data_path, index=i, action_group="Location")
-                    fcurve.keyframe_points.add(num_frames)
-                    fcurve.keyframe_points.foreach_set('co', loc_cache["curves"][i][:set_count])
+                    add_fcurve_keys(fcurves, loc_path, i, "Location", num_frames, curves[i])
                 for i in range(0, 3):
-                    data_path = pose_bone.path_from_id("scale")
-                    fcurve = rig_action.fcurves.new(data_path, index=i, action_group="Scale")
-                    fcurve.keyframe_points.add(num_frames)
-                    fcurve.keyframe_points.foreach_set('co', sca_cache["curves"][i][:set_count])
+                    add_fcurve_keys(fcurves, sca_path, i, "Scale", num_frames, curves[3 + i])
                 for i in range(0, 4):
-                    data_path = pose_bone.path_from_id("rotation_quaternion")
-                    fcurve = rig_action.fcurves.new(data_path, index=i, action_group="Rotation Quaternion")
-                    fcurve.keyframe_points.add(num_frames)
-                    fcurve.keyframe_points.foreach_set('co', rot_cache["curves"][i][:set_count])
+                    add_fcurve_keys(fcurves, rot_path, i, "Rotation Quaternion", num_frames, curves[6 + i])
 
-        expression_cache = actor.cache["expressions"]
-        viseme_cache = actor.cache["visemes"]
+        key_caches = ((actor.cache["expressions"], "Expression"),
+                      (actor.cache["visemes"], "Viseme"))
         for obj in objects:
-            obj_action = utils.safe_get_action(obj.data.shape_keys)
+            shape_keys = obj.data.shape_keys
+            obj_action = utils.safe_get_action(shape_keys)
             if obj_action:
-                utils.clear_prop_collection(obj_action.fcurves)
-                for expression_name in expression_cache:
-                    if expression_name in obj.data.shape_keys.key_blocks:
-                        key_cache = expression_cache[expression_name]
-                        key = obj.data.shape_keys.key_blocks[expression_name]
-                        data_path = key.path_from_id("value")
-                        fcurve = obj_action.fcurves.new(data_path, action_group="Expression")
-                        fcurve.keyframe_points.add(num_frames)
-                        fcurve.keyframe_points.foreach_set('co', key_cache["curves"][0][:set_count])
-                for viseme_name in viseme_cache:
-                    if viseme_name in obj.data.shape_keys.key_blocks:
-                        key_cache = viseme_cache[viseme_name]
-                        key = obj.data.shape_keys.key_blocks[viseme_name]
-                        data_path = key.path_from_id("value")
-                        fcurve = obj_action.fcurves.new(data_path, action_group="Viseme")
-                        fcurve.keyframe_points.add(num_frames)
-                        fcurve.keyframe_points.foreach_set('co', key_cache["curves"][0][:set_count])
+                fcurves = obj_action.fcurves
+                utils.clear_prop_collection(fcurves)
+                key_blocks = shape_keys.key_blocks
+                for key_cache, action_group in key_caches:
+                    for key_name, curve_cache in key_cache.items():
+                        key = key_blocks.get(key_name)
+                        if key:
+                            data_path = key.path_from_id("value")
+                            add_fcurve_keys(fcurves, data_path, 0, action_group, num_frames,
+                                            curve_cache["curves"][0][:set_count])
         # remove actions from non sequence objects
         for obj in none_objects:
             utils.safe_set_action(obj.data.shape_keys, None)
@@ -966,19 +1310,22 @@ def write_sequence_actions(actor: LinkActor, num_frames):
 
 
 class Signal():
-    callbacks: list = None
+    # immutable, so (dis)connecting during an emit can't disturb the iteration
+    callbacks: tuple = None
 
     def __init__(self):
-        self.callbacks = []
+        self.callbacks = ()
 
     def connect(self, func):
-        self.callbacks.append(func)
+        self.callbacks = self.callbacks + (func,)
 
     def disconnect(self, func=None):
         if func:
-            self.callbacks.remove(func)
+            callbacks = list(self.callbacks)
+            callbacks.remove(func)
+            self.callbacks = tuple(callbacks)
         else:
-            self.callbacks.clear()
+            self.callbacks = ()
 
     def emit(self, *args):
         for func in self.callbacks:
@@ -989,9 +1336,6 @@ class LinkService():
     timer = None
     server_sock: socket.socket = None
     client_sock: socket.socket = None
-    server_sockets = []
-    client_sockets = []
-    empty_sockets = []
     client_ip: str = "127.0.0.1"
     client_port: int = BLENDER_PORT
     is_listening: bool = False
@@ -1030,10 +1374,56 @@ class LinkService():
     remote_exe: str = None
     plugin_version: str = None
     link_data: LinkData = None
+    # persistent receive buffer
+    recv_buffer: bytearray = None
+    recv_view: memoryview = None
+    recv_start: int = 0
+    recv_end: int = 0
+    server_selector: selectors.BaseSelector = None
+    # background receive thread
+    recv_thread: threading.Thread = None
+    recv_thread_stop: threading.Event = None
+    recv_queue: queue.SimpleQueue = None
+    # reusable send buffer
+    send_buffer: bytearray = None
+    send_view: memoryview = None
+    # op_code -> receive handler
+    parse_handlers: dict = None
 
     def __init__(self):
-        global LINK_DATA
         self.link_data = LINK_DATA
+        self.recv_buffer = bytearray(MAX_CHUNK_SIZE * 4)
+        self.recv_view = memoryview(self.recv_buffer)
+        self.server_selector = selectors.DefaultSelector()
+        self.send_buffer = bytearray(65536)
+        self.send_view = memoryview(self.send_buffer)
+        self.parse_handlers = {
+            OpCodes.HELLO: self.receive_hello,
+            OpCodes.PING: self.receive_ping,
+            OpCodes.STOP: self.receive_stop,
+            OpCodes.DISCONNECT: self.receive_disconnect,
+            OpCodes.NOTIFY: self.receive_notify,
+            OpCodes.DEBUG: self.receive_debug,
+            OpCodes.SAVE: self.receive_save,
+            OpCodes.TEMPLATE: self.receive_character_template,
+            OpCodes.POSE: self.receive_pose,
+            OpCodes.POSE_FRAME: self.receive_pose_frame,
+            OpCodes.MORPH: self.receive_morph,
+            OpCodes.MORPH_UPDATE: self.receive_morph_update,
+            OpCodes.CHARACTER: self.receive_character_import,
+            OpCodes.PROP: self.receive_character_import,
+            OpCodes.MOTION: self.receive_motion_import,
+            OpCodes.CHARACTER_UPDATE: self.receive_actor_update,
+            OpCodes.UPDATE_REPLACE: self.receive_update_replace,
+            OpCodes.RIGIFY: self.receive_rigify_request,
+            OpCodes.SEQUENCE: self.receive_sequence,
+            OpCodes.SEQUENCE_FRAME: self.receive_sequence_frame,
+            OpCodes.SEQUENCE_END: self.receive_sequence_end,
+            OpCodes.SEQUENCE_ACK: self.receive_sequence_ack,
+            OpCodes.LIGHTS: self.receive_lights,
+            OpCodes.CAMERA_SYNC: self.receive_camera_sync,
+            OpCodes.FRAME_SYNC: self.receive_frame_sync,
+        }
         atexit.register(self.service_disconnect)
 
     def __enter__(self):
@@ -1061,23 +1451,26 @@ class LinkService():
                 self.keepalive_timer = HANDSHAKE_TIMEOUT_S
                 self.server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 self.server_sock.settimeout(SOCKET_TIMEOUT)
+                # set before listening so the accepted sockets start out with them
+                self.set_socket_options(self.server_sock)
                 self.server_sock.bind(('', BLENDER_PORT))
                 self.server_sock.listen(5)
                 #self.server_sock.setblocking(False)
-                self.server_sockets = [self.server_sock]
+                self.server_selector.register(self.server_sock, selectors.EVENT_READ)
                 self.is_listening = True
                 utils.log_info(f"Listening on TCP *:{BLENDER_PORT}")
                 self.listening.emit()
                 self.changed.emit()
             except Exception as e:
+                self.unregister_server_sock()
                 self.server_sock = None
-                self.server_sockets = []
                 self.is_listening = True
                 utils.log_error(f"Unable to start server on TCP *:{BLENDER_PORT}", e)
 
     def stop_server(self):
         if self.server_sock:
-            utils.log_info(f"Closing Server Socket")
+            utils.log_info("Closing Server Socket")
+            self.unregister_server_sock()
             try:
                 self.server_sock.shutdown()
                 self.server_sock.close()
@@ -1085,16 +1478,22 @@ class LinkService():
                 pass
         self.is_listening = False
         self.server_sock = None
-        self.server_sockets = []
         self.server_stopped.emit()
         self.changed.emit()
 
+    def unregister_server_sock(self):
+        if self.server_sock:
+            try:
+                self.server_selector.unregister(self.server_sock)
+            except:
+                pass
+
     def start_timer(self):
         self.time = time.time()
         if not self.timer:
             bpy.app.timers.register(self.loop, first_interval=TIMER_INTERVAL)
             self.timer = True
-            utils.log_info(f"Service timer started")
+            utils.log_info("Service timer started")
 
     def stop_timer(self):
         if self.timer:
@@ -1103,23 +1502,44 @@ class LinkService():
             except:
                 pass
             self.timer = False
-            utils.log_info(f"Service timer stopped")
+            utils.log_info("Service timer stopped")
+
+    def set_socket_options(self, sock: socket.socket):
+        """Disable Nagle and enlarge the socket buffers for the pose streaming."""
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            if hasattr(socket, "TCP_QUICKACK"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except Exception as e:
+            utils.log_warn(f"Unable to set socket options: {e}")
+
+    def register_client_sock(self, sock):
+        # non-blocking so the receive buffer can be drained until there is no more data,
+        # recv_into raising BlockingIOError doubles as the readability check
+        sock.setblocking(False)
+        self.client_sock = sock
+        self.reset_recv_buffer()
+        if USE_RECV_THREAD:
+            self.start_recv_thread(sock)
 
     def try_start_client(self, host, port):
         link_props = vars.link_props()
 
         if not self.client_sock:
-            utils.log_info(f"Attempting to connect")
+            utils.log_info("Attempting to connect")
             try:
                 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 sock.settimeout(SOCKET_TIMEOUT)
+                # before connecting, so the enlarged receive buffer is used for the TCP window scaling
+                self.set_socket_options(sock)
                 sock.connect((host, port))
                 #sock.setblocking(False)
                 self.is_connected = False
                 link_props.connected = False
                 self.is_connecting = True
-                self.client_sock = sock
-                self.client_sockets = [sock]
+                self.register_client_sock(sock)
                 self.client_ip = host
                 self.client_port = port
                 self.keepalive_timer = KEEPALIVE_TIMEOUT_S
@@ -1131,14 +1551,13 @@ class LinkService():
                 return True
             except:
                 self.client_sock = None
-                self.client_sockets = []
                 self.is_connected = False
                 link_props.connected = False
                 self.is_connecting = False
-                utils.log_info(f"Client socket connect failed!")
+                utils.log_info("Client socket connect failed!")
                 return False
         else:
-            utils.log_info(f"Client already connected!")
+            utils.log_info("Client already connected!")
             return True
 
     def send_hello(self):
@@ -1156,7 +1575,8 @@ class LinkService():
 
     def stop_client(self):
         if self.client_sock:
-            utils.log_info(f"Closing Client Socket")
+            utils.log_info("Closing Client Socket")
+            self.stop_recv_thread()
             try:
                 self.client_sock.shutdown()
                 self.client_sock.close()
@@ -1170,7 +1590,6 @@ class LinkService():
         except:
             pass
         self.client_sock = None
-        self.client_sockets = []
         if self.listening:
             self.keepalive_timer = HANDSHAKE_TIMEOUT_S
         self.client_stopped.emit()
@@ -1182,49 +1601,149 @@ class LinkService():
         else:
             return False
 
+    def reset_recv_buffer(self):
+        self.recv_start = 0
+        self.recv_end = 0
+
+    def grow_recv_buffer(self, size):
+        # replace rather than resize, the old buffer may still be exported by a memoryview
+        recv_buffer = bytearray(max(size, len(self.recv_buffer) * 2))
+        recv_buffer[:self.recv_end] = self.recv_buffer[:self.recv_end]
+        self.recv_buffer = recv_buffer
+        self.recv_view = memoryview(self.recv_buffer)
+
+    def pending_message_size(self):
+        """Size of the next framed message in the receive buffer (header included) or 0 if the header is incomplete."""
+        if self.recv_end - self.recv_start >= HEADER_STRUCT.size:
+            op_code, size = HEADER_STRUCT.unpack_from(self.recv_buffer, self.recv_start)
+            return HEADER_STRUCT.size + size
+        return 0
+
+    def has_message(self):
+        size = self.pending_message_size()
+        return size > 0 and self.recv_end - self.recv_start >= size
+
+    def next_message(self):
+        """Returns the next complete (op_code, data) message in the receive buffer, or None.
+           data is a memoryview into the receive buffer and only valid until the next recv."""
+        if not self.has_message():
+            return None
+        op_code, size = HEADER_STRUCT.unpack_from(self.recv_buffer, self.recv_start)
+        start = self.recv_start + HEADER_STRUCT.size
+        self.recv_start = start + size
+        data = self.recv_view[start:start+size] if size > 0 else None
+        return op_code, data
+
+    def recv_socket(self, sock: socket.socket):
+        """Drains the data waiting on the (non-blocking) socket into the receive buffer.
+           Returns False if the socket was closed by the client, raises on socket errors.
+           (Called from the receive thread, so no bpy access or logging in here.)"""
+        # move any partial message to the front of the buffer
+        if self.recv_start > 0:
+            remaining = self.recv_end - self.recv_start
+            self.recv_buffer[:remaining] = self.recv_buffer[self.recv_start:self.recv_end]
+            self.recv_start = 0
+            self.recv_end = remaining
+        while True:
+            if self.recv_end == len(self.recv_buffer):
+                # stop reading if there is a message to parse, otherwise make room for it
+                if self.has_message():
+                    return True
+                self.grow_recv_buffer(max(self.pending_message_size(), self.recv_end + MAX_CHUNK_SIZE))
+            try:
+                n = sock.recv_into(self.recv_view[self.recv_end:])
+            except BlockingIOError:
+                return True
+            if n == 0:
+                return False
+            self.recv_end += n
+
+    def start_recv_thread(self, sock: socket.socket):
+        self.recv_queue = queue.SimpleQueue()
+        self.recv_thread_stop = threading.Event()
+        self.recv_thread = threading.Thread(target=self.recv_thread_loop,
+                                            args=(sock, self.recv_queue, self.recv_thread_stop),
+                                            daemon=True)
+        self.recv_thread.start()
+
+    def stop_recv_thread(self):
+        if self.recv_thread:
+            self.recv_thread_stop.set()
+            # the thread wakes up at least every RECV_THREAD_POLL seconds,
+            # wait for it so the receive buffer can safely be reused
+            self.recv_thread.join(RECV_THREAD_POLL * 10)
+            self.recv_thread = None
+
+    def recv_thread_loop(self, sock: socket.socket, recv_queue: queue.SimpleQueue, stop: threading.Event):
+        """Receive thread: frames the incoming data into (op_code, data) messages on the receive queue.
+           Ends with a (None, None) message when the socket is closed or (None, exception) on error."""
+        try:
+            with selectors.DefaultSelector() as read_selector:
+                read_selector.register(sock, selectors.EVENT_READ)
+                while not stop.is_set():
+                    if not read_selector.select(RECV_THREAD_POLL):
+                        continue
+                    is_open = self.recv_socket(sock)
+                    message = self.next_message()
+                    while message:
+                        op_code, data = message
+                        # copy out of the receive buffer, it is reused by the next recv
+                        recv_queue.put((op_code, bytes(data) if data else None))
+                        message = self.next_message()
+                    if not is_open:
+                        recv_queue.put((None, None))
+                        return
+        except Exception as e:
+            if not stop.is_set():
+                recv_queue.put((None, e))
+
+    def has_queued_message(self):
+        return not self.recv_queue.empty()
+
+    def next_queued_message(self):
+        """Returns the next (op_code, data) message from the receive thread, or None."""
+        try:
+            op_code, data = self.recv_queue.get_nowait()
+        except queue.Empty:
+            return None
+        if op_code is None:
+            # the receive thread has ended
+            if data:
+                utils.log_error("Client socket recv:recv failed!", data)
+            else:
+                utils.log_always("Socket closed by client")
+            self.client_lost()
+            return None
+        return op_code, data
+
     def recv(self):
         prefs = vars.prefs()
 
         self.is_data = False
         self.is_import = False
         if self.has_client_sock():
-            try:
-                r,w,x = select.select(self.client_sockets, self.empty_sockets, self.empty_sockets, 0)
-            except Exception as e:
-                utils.log_error("Client socket recv:select failed!", e)
-                self.client_lost()
-                return
-            count = 0
-            while r:
-                op_code = None
+            if self.recv_thread:
+                next_message = self.next_queued_message
+                has_message = self.has_queued_message
+            else:
                 try:
-                    header = self.client_sock.recv(8)
-                    if header == 0:
+                    if not self.recv_socket(self.client_sock):
                         utils.log_always("Socket closed by client")
                         self.client_lost()
                         return
                 except Exception as e:
-                    utils.log_error("Client socket recv:recv header failed!", e)
+                    utils.log_error("Client socket recv:recv failed!", e)
                     self.client_lost()
                     return
-                if header and len(header) == 8:
-                    op_code, size = struct.unpack("!II", header)
-                    data = None
-                    if size > 0:
-                        data = bytearray()
-                        while size > 0:
-                            chunk_size = min(size, MAX_CHUNK_SIZE)
-                            try:
-                                chunk = self.client_sock.recv(chunk_size)
-                            except Exception as e:
-                                utils.log_error("Client socket recv:recv chunk failed!", e)
-                                self.client_lost()
-                                return
-                            data.extend(chunk)
-                            size -= len(chunk)
-                    self.parse(op_code, data)
-                    self.received.emit(op_code, data)
-                    count += 1
+                next_message = self.next_message
+                has_message = self.has_message
+            count = 0
+            message = next_message()
+            while message:
+                op_code, data = message
+                self.parse(op_code, data)
+                self.received.emit(op_code, data)
+                count += 1
                 self.is_data = False
                 # parse may have received a disconnect notice
                 if not self.has_client_sock():
@@ -1238,22 +1757,17 @@ class LinkService():
                     self.is_data = False
                     self.is_import = True
                     return
-                try:
-                    r,w,x = select.select(self.client_sockets, self.empty_sockets, self.empty_sockets, 0)
-                except Exception as e:
-                    utils.log_error("Client socket recv:select (reselect) failed!", e)
-                    self.client_lost()
-                    return
-                if r:
+                if has_message():
                     self.is_data = True
                     if count >= MAX_RECEIVE or op_code == OpCodes.NOTIFY:
                         return
+                message = next_message()
 
     def accept(self):
         link_props = vars.link_props()
 
         if self.server_sock and self.is_listening:
-            r,w,x = select.select(self.server_sockets, self.empty_sockets, self.empty_sockets, 0)
+            r = self.server_selector.select(0)
             while r:
                 try:
                     sock, address = self.server_sock.accept()
@@ -1261,8 +1775,8 @@ class LinkService():
                     utils.log_error("Server socket accept failed!", e)
                     self.service_lost()
                     return
-                self.client_sock = sock
-                self.client_sockets = [sock]
+                self.set_socket_options(sock)
+                self.register_client_sock(sock)
                 self.client_ip = address[0]
                 self.client_port = address[1]
                 self.is_connected = False
@@ -1274,121 +1788,55 @@ class LinkService():
                 self.send_hello()
                 self.accepted.emit(self.client_ip, self.client_port)
                 self.changed.emit()
-                r,w,x = select.select(self.server_sockets, self.empty_sockets, self.empty_sockets, 0)
+                r = self.server_selector.select(0)
 
     def parse(self, op_code, data):
-        props = vars.props()
-        link_props = vars.link_props()
         self.keepalive_timer = KEEPALIVE_TIMEOUT_S
+        handler = self.parse_handlers.get(op_code)
+        if handler:
+            handler(data)
 
-        if op_code == OpCodes.HELLO:
-            utils.log_info(f"Hello Received")
-            if data:
-                json_data = decode_to_json(data)
-                self.remote_app = json_data["Application"]
-                self.remote_version = json_data["Version"]
-                self.remote_path = json_data["Path"]
-                self.remote_exe = json_data["Exe"]
-                self.plugin_version = json_data.get("Plugin", "")
-                self.link_data.remote_app = self.remote_app
-                self.link_data.remote_version = self.remote_version
-                self.link_data.remote_path = self.remote_path
-                self.link_data.remote_exe = self.remote_exe
-                if self.compatible_plugin(self.plugin_version):
-                    self.service_initialize()
-                    link_props.remote_app = self.remote_app
-                    link_props.remote_version = f"{self.remote_version[0]}.{self.remote_version[1]}.{self.remote_version[2]}"
-                    link_props.remote_path = self.remote_path
-                    link_props.remote_exe = self.remote_exe
-                    utils.log_always(f"Connected to: {self.remote_app} {self.remote_version} / {self.plugin_version}")
-                    utils.log_always(f"Using file path: {self.remote_path}")
-                    utils.log_always(f"Using exe path: {self.remote_exe}")
-                else:
-                    self.service_disconnect()
-                    messages = ["CC/iC Plug-in and Blender Add-on versions do not match!",
-                                f"Blender add-on version: {vars.VERSION_STRING}",
-                                f"CC/iC plug-in version: {self.plugin_version}",
-                                f"*Compatible plug-in versions: {vars.PLUGIN_COMPATIBLE}"]
-                    utils.message_box_multi("Version Error", icon="ERROR", messages=messages)
-
-
-        elif op_code == OpCodes.PING:
-            utils.log_info(f"Ping Received")
-
-        elif op_code == OpCodes.STOP:
-            utils.log_info(f"Termination Received")
-            self.service_stop()
-
-        elif op_code == OpCodes.DISCONNECT:
-            utils.log_info(f"Disconnection Received")
-            self.service_recv_disconnected()
-
-        elif op_code == OpCodes.NOTIFY:
-            self.receive_notify(data)
-
-        elif op_code == OpCodes.DEBUG:
-            self.receive_debug(data)
-
-        ##
-        #
-
-        elif op_code == OpCodes.SAVE:
-            self.receive_save(data)
-
-        elif op_code == OpCodes.TEMPLATE:
-            self.receive_character_template(data)
-
-        elif op_code == OpCodes.POSE:
-            self.receive_pose(data)
-
-        elif op_code == OpCodes.POSE_FRAME:
-            self.receive_pose_frame(data)
-
-        elif op_code == OpCodes.MORPH:
-            self.receive_morph(data)
-
-        elif op_code == OpCodes.MORPH_UPDATE:
-            self.receive_morph(data, update=True)
-
-        elif op_code == OpCodes.CHARACTER:
-            self.receive_character_import(data)
-
-        elif op_code == OpCodes.PROP:
-            self.receive_character_import(data)
-
-        elif op_code == OpCodes.MOTION:
-            self.receive_motion_import(data)
-
-        elif op_code == OpCodes.CHARACTER_UPDATE:
-            self.receive_actor_update(data)
-
-        elif op_code == OpCodes.UPDATE_REPLACE:
-            self.receive_update_replace(data)
-
-        elif op_code == OpCodes.RIGIFY:
-            self.receive_rigify_request(data)
-
-        elif op_code == OpCodes.SEQUENCE:
-            self.receive_sequence(data)
-
-        elif op_code == OpCodes.SEQUENCE_FRAME:
-            self.receive_sequence_frame(data)
-
-        elif op_code == OpCodes.SEQUENCE_END:
-            self.receive_sequence_end(data)
-
-        elif op_code == OpCodes.SEQUENCE_ACK:
-            self.receive_sequence_ack(data)
-
-        elif op_code == OpCodes.LIGHTS:
-            self.receive_lights(data)
-
-        elif op_code == OpCodes.CAMERA_SYNC:
-            self.receive_camera_sync(data)
-
-        elif op_code == OpCodes.FRAME_SYNC:
-            self.receive_frame_sync(data)
+    def receive_hello(self, data):
+        link_props = vars.link_props()
+        utils.log_info("Hello Received")
+        if data:
+            json_data = decode_to_json(data)
+            self.remote_app = json_data["Application"]
+            self.remote_version = json_data["Version"]
+            self.remote_path = json_data["Path"]
+            self.remote_exe = json_data["Exe"]
+            self.plugin_version = json_data.get("Plugin", "")
+            self.link_data.remote_app = self.remote_app
+            self.link_data.remote_version = self.remote_version
+            self.link_data.remote_path = self.remote_path
+            self.link_data.remote_exe = self.remote_exe
+            if self.compatible_plugin(self.plugin_version):
+                self.service_initialize()
+                link_props.remote_app = self.remote_app
+                link_props.remote_version = f"{self.remote_version[0]}.{self.remote_version[1]}.{self.remote_version[2]}"
+                link_props.remote_path = self.remote_path
+                link_props.remote_exe = self.remote_exe
+                utils.log_always(f"Connected to: {self.remote_app} {self.remote_version} / {self.plugin_version}")
+                utils.log_always(f"Using file path: {self.remote_path}")
+                utils.log_always(f"Using exe path: {self.remote_exe}")
+            else:
+                self.service_disconnect()
+                messages = ["CC/iC Plug-in and Blender Add-on versions do not match!",
+                            f"Blender add-on version: {vars.VERSION_STRING}",
+                            f"CC/iC plug-in version: {self.plugin_version}",
+                            f"*Compatible plug-in versions: {vars.PLUGIN_COMPATIBLE}"]
+                utils.message_box_multi("Version Error", icon="ERROR", messages=messages)
+
+    def receive_ping(self, data):
+        utils.log_info("Ping Received")
+
+    def receive_stop(self, data):
+        utils.log_info("Termination Received")
+        self.service_stop()
 
+    def receive_disconnect(self, data):
+        utils.log_info("Disconnection Received")
+        self.service_recv_disconnected()
 
     def service_start(self, host, port):
         if not self.is_listening:
@@ -1517,17 +1965,81 @@ class LinkService():
             return TIMER_INTERVAL
 
 
+    def wait_writable(self):
+        # rare, only when the kernel send buffer is full
+        with selectors.DefaultSelector() as write_selector:
+            write_selector.register(self.client_sock, selectors.EVENT_WRITE)
+            if not write_selector.select(SOCKET_TIMEOUT):
+                raise TimeoutError("Client socket send timed out!")
+
+    def send_all(self, data):
+        """sendall for the non-blocking client socket:
+           waits (up to the socket timeout) for the socket to become writable when the send buffer is full."""
+        sent = 0
+        total = len(data)
+        while sent < total:
+            try:
+                sent += self.client_sock.send(data[sent:])
+            except BlockingIOError:
+                self.wait_writable()
+
+    def send_all_gather(self, buffers):
+        """sendall for a list of buffers using gather I/O (sendmsg), resuming after partial sends."""
+        buffers = [ memoryview(buffer) for buffer in buffers if len(buffer) ]
+        while buffers:
+            try:
+                sent = self.client_sock.sendmsg(buffers)
+            except BlockingIOError:
+                self.wait_writable()
+                continue
+            # drop the fully sent buffers and trim the partially sent one
+            while sent:
+                size = len(buffers[0])
+                if sent >= size:
+                    sent -= size
+                    buffers.pop(0)
+                else:
+                    buffers[0] = buffers[0][sent:]
+                    sent = 0
+
     def send(self, op_code, binary_data = None):
+        self.send_many([(op_code, binary_data)])
+
+    def send_many(self, messages):
+        """Sends the (op_code, binary_data) messages in one go:
+           gathered straight from the payloads with sendmsg where available,
+           otherwise framed into the send buffer."""
         try:
             if self.client_sock and (self.is_connected or self.is_connecting):
-                data_length = len(binary_data) if binary_data else 0
-                header = struct.pack("!II", op_code, data_length)
-                data = bytearray()
-                data.extend(header)
-                if binary_data:
-                    data.extend(binary_data)
+                gather = USE_SENDMSG and hasattr(self.client_sock, "sendmsg")
+                total_length = 0
+                for op_code, binary_data in messages:
+                    total_length += HEADER_STRUCT.size
+                    if not gather:
+                        total_length += len(binary_data) if binary_data else 0
+                if total_length > len(self.send_buffer):
+                    # replace rather than resize, the old buffer may still be exported by a memoryview
+                    self.send_buffer = bytearray(max(total_length, len(self.send_buffer) * 2))
+                    self.send_view = memoryview(self.send_buffer)
+                # write the headers (and payloads when not gathering) into the send buffer
+                offset = 0
+                buffers = []
+                for op_code, binary_data in messages:
+                    data_length = len(binary_data) if binary_data else 0
+                    HEADER_STRUCT.pack_into(self.send_buffer, offset, op_code, data_length)
+                    if gather:
+                        buffers.append(self.send_view[offset:offset + HEADER_STRUCT.size])
+                        if binary_data:
+                            buffers.append(binary_data)
+                    offset += HEADER_STRUCT.size
+                    if binary_data and not gather:
+                        self.send_buffer[offset:offset + data_length] = binary_data
+                        offset += data_length
                 try:
-                    self.client_sock.sendall(data)
+                    if gather:
+                        self.send_all_gather(buffers)
+                    else:
+                        self.send_all(self.send_view[:total_length])
                 except Exception as e:
                     utils.log_error("Client socket sendall failed!")
                     self.client_lost()
@@ -1559,7 +2071,7 @@ class LinkService():
             self.sequence_send_rate = count
             self.sequence_send_count = count
             if self.loop_count % 30 == 0:
-                utils.log_info(f"send_count: {self.sequence_send_count} delta_frames: {delta_frames}")
+                utils.log_info("send_count: %s delta_frames: %s", self.sequence_send_count, delta_frames)
 
 
     def on_connected(self):
@@ -1607,7 +2119,6 @@ class LinkService():
         return export_path
 
     def get_actor_from_object(self, obj):
-        global LINK_DATA
         props = vars.props()
         chr_cache = props.get_character_cache(obj, None)
         if chr_cache:
@@ -1616,7 +2127,6 @@ class LinkService():
         return None
 
     def get_selected_actors(self):
-        global LINK_DATA
         props = vars.props()
 
         selected_objects = bpy.context.selected_objects
@@ -1629,9 +2139,11 @@ class LinkService():
             cache_actors.append(avatars[0])
 
         else:
+            found = set()
             for obj in selected_objects:
                 chr_cache = props.get_character_cache(obj, None)
-                if chr_cache and chr_cache not in cache_actors:
+                if chr_cache and chr_cache not in found:
+                    found.add(chr_cache)
                     cache_actors.append(chr_cache)
 
         for chr_cache in cache_actors:
@@ -1655,7 +2167,6 @@ class LinkService():
 
 
     def get_active_actor(self):
-        global LINK_DATA
         props = vars.props()
         active_object = utils.get_active_object()
         if active_object:
@@ -1864,10 +2375,15 @@ class LinkService():
                 else:
                     export_rig = rigging.adv_export_pair_rigs(chr_cache, link_target=True)[0]
                 # get all the exportable deformation bones
+                bone_indices = []
                 if rigutils.select_rig(export_rig):
-                    for pose_bone in export_rig.pose.bones:
+                    for i, pose_bone in enumerate(export_rig.pose.bones):
                         if pose_bone.name != "root" and not pose_bone.name.startswith("DEF-"):
                             bones.append(pose_bone.name)
+                            bone_indices.append(i)
+                # the pose frames are sent from these bones in the export rig
+                actor.export_rig = export_rig
+                actor.export_bone_indices = bone_indices
                 driver_mode = "BONE"
             else:
                 # get all the bones
@@ -1875,6 +2391,8 @@ class LinkService():
                 if rigutils.select_rig(rig):
                     for pose_bone in rig.pose.bones:
                         bones.append(pose_bone.name)
+                actor.export_rig = rig
+                actor.export_bone_indices = None
                 if drivers.has_facial_shape_key_bone_drivers(chr_cache):
                     driver_mode = "EXPRESSION"
                 else:
@@ -1925,67 +2443,38 @@ class LinkService():
         return encode_from_json(data)
 
     def encode_pose_frame_data(self, actors: list):
-        pose_bone: bpy.types.PoseBone
         data = bytearray()
-        data += struct.pack("!II", len(actors), BFA(bpy.context.scene.frame_current))
+        data += HEADER_STRUCT.pack(len(actors), BFA(bpy.context.scene.frame_current))
+        # reading the pose bone matrices only needs object mode, not the rigs to be selected and active,
+        # so check the mode once per frame instead of selecting and activating each rig in turn
+        object_mode = utils.set_mode("OBJECT")
         actor: LinkActor
         for actor in actors:
             data += pack_string(actor.name)
             data += pack_string(actor.get_type())
             data += pack_string(actor.get_link_id())
             chr_cache = actor.get_chr_cache()
-
-            if chr_cache.rigified:
-                # add the import retarget rig
-                if utils.object_exists_is_armature(chr_cache.rig_export_rig):
-                    export_rig = chr_cache.rig_export_rig
-                else:
-                    export_rig = rigging.adv_export_pair_rigs(chr_cache, link_target=True)[0]
-                M: Matrix = export_rig.matrix_world
-
-                # pack object transform
-                T: Matrix = M
-                t = T.to_translation() * 100
-                r = T.to_quaternion()
-                s = T.to_scale()
-                data += struct.pack("!ffffffffff", t.x, t.y, t.z, r.x, r.y, r.z, r.w, s.x, s.y, s.z)
-
-                # pack all the bone data for the exportable deformation bones
-                data += struct.pack("!I", len(actor.bones))
-                if utils.object_mode_to(export_rig):
-                    for bone_name in actor.bones:
-                        pose_bone = export_rig.pose.bones[bone_name]
-                        T: Matrix = M @ pose_bone.matrix
-                        t = T.to_translation() * 100
-                        r = T.to_quaternion()
-                        s = T.to_scale()
-                        data += struct.pack("!ffffffffff", t.x, t.y, t.z, r.x, r.y, r.z, r.w, s.x, s.y, s.z)
-            else:
-                rig: bpy.types.Object = chr_cache.get_armature()
-                M: Matrix = rig.matrix_world
-
-                # pack object transform
-                T: Matrix = M
-                t = T.to_translation() * 100
-                r = T.to_quaternion()
-                s = T.to_scale()
-                data += struct.pack("!ffffffffff", t.x, t.y, t.z, r.x, r.y, r.z, r.w, s.x, s.y, s.z)
-
-                # pack all the bone data
-                data += struct.pack("!I", len(rig.pose.bones))
-                if utils.object_mode_to(rig):
-                    pose_bone: bpy.types.PoseBone
-                    for pose_bone in rig.pose.bones:
-                        T: Matrix = M @ pose_bone.matrix
-                        t = T.to_translation()
-                        r = T.to_quaternion()
-                        s = T.to_scale()
-                        data += struct.pack("!ffffffffff", t.x, t.y, t.z, r.x, r.y, r.z, r.w, s.x, s.y, s.z)
+            export_rig, bone_indices = actor.get_export_rig()
+            M: Matrix = export_rig.matrix_world
+
+            # pack object transform
+            T: Matrix = M
+            t = T.to_translation() * 100
+            r = T.to_quaternion()
+            s = T.to_scale()
+            data += TRANSFORM_STRUCT.pack(t.x, t.y, t.z, r.x, r.y, r.z, r.w, s.x, s.y, s.z)
+
+            # pack all the bone data (for a rigified character just the exportable deformation bones)
+            num_bones = len(export_rig.pose.bones) if bone_indices is None else len(bone_indices)
+            data += LENGTH_STRUCT.pack(num_bones)
+            if object_mode and utils.object_exists(export_rig):
+                translation_scale = 100 if chr_cache.rigified else 1
+                data += pack_pose_bone_transforms(export_rig, M, bone_indices, translation_scale)
 
             # pack shape_keys
-            data += struct.pack("!I", len(actor.shape_keys))
-            for shape_key, key in actor.shape_keys.items():
-                data += struct.pack("!f", key.value)
+            data += LENGTH_STRUCT.pack(len(actor.shape_keys))
+            if actor.shape_keys:
+                data += np.array([key.value for key in actor.shape_keys.values()], dtype=">f4").tobytes()
 
         return data
 
@@ -2026,32 +2515,31 @@ class LinkService():
                     rigutils.restore_ik_stretch(actor.ik_store)
 
     def send_pose(self):
-        global LINK_DATA
-
         # get actors
         actors = self.get_selected_actors()
         count = 0
         if actors:
             mode_selection = utils.store_mode_selection_state()
-            update_link_status(f"Sending Current Pose Set")
-            self.send_notify(f"Pose Set")
-            # send pose info
+            update_link_status("Sending Current Pose Set")
+            self.send_notify("Pose Set")
+            # pose info
             pose_data = self.encode_pose_data(actors)
-            self.send(OpCodes.POSE, pose_data)
-            # send template data first
+            # template data
             template_data = self.encode_character_templates(actors)
-            self.send(OpCodes.TEMPLATE, template_data)
             # store the actors
-            LINK_DATA.sequence_actors = actors
+            LINK_DATA.set_sequence_actors(actors)
             LINK_DATA.sequence_type = "POSE"
             # force recalculate all transforms
             bpy.context.view_layer.update()
-            # send pose data
+            # pose data
             pose_frame_data = self.encode_pose_frame_data(actors)
-            self.send(OpCodes.POSE_FRAME, pose_frame_data)
+            # send pose info, template and pose data together
+            self.send_many([(OpCodes.POSE, pose_data),
+                            (OpCodes.TEMPLATE, template_data),
+                            (OpCodes.POSE_FRAME, pose_frame_data)])
             # clear the actors
             self.restore_actor_rigs(LINK_DATA.sequence_actors)
-            LINK_DATA.sequence_actors = None
+            LINK_DATA.set_sequence_actors(None)
             LINK_DATA.sequence_type = None
             # restore
             utils.restore_mode_selection_state(mode_selection)
@@ -2062,7 +2550,6 @@ class LinkService():
         return
 
     def abort_sequence(self):
-        global LINK_DATA
         # as the next frame was never sent, go back 1 frame
         LINK_DATA.sequence_current_frame = prev_frame(LINK_DATA.sequence_current_frame)
         update_link_status(f"Sequence Aborted: {LINK_DATA.sequence_current_frame}")
@@ -2070,34 +2557,29 @@ class LinkService():
         self.send_sequence_end()
 
     def send_sequence(self):
-        global LINK_DATA
-
         # get actors
         actors = self.get_selected_actors()
         if actors:
-            update_link_status(f"Sending Animation Sequence")
-            self.send_notify(f"Animation Sequence")
+            update_link_status("Sending Animation Sequence")
+            self.send_notify("Animation Sequence")
             # reset animation to start
             bpy.context.scene.frame_current = bpy.context.scene.frame_start
             LINK_DATA.sequence_current_frame = bpy.context.scene.frame_current
-            # send animation meta data
+            # send animation meta data and template data together
             sequence_data = self.encode_sequence_data(actors)
-            self.send(OpCodes.SEQUENCE, sequence_data)
-            # send template data first
             template_data = self.encode_character_templates(actors)
-            self.send(OpCodes.TEMPLATE, template_data)
+            self.send_many([(OpCodes.SEQUENCE, sequence_data),
+                            (OpCodes.TEMPLATE, template_data)])
             # store the actors
-            LINK_DATA.sequence_actors = actors
+            LINK_DATA.set_sequence_actors(actors)
             LINK_DATA.sequence_type = "SEQUENCE"
             # start the sending sequence
             self.start_sequence(self.send_sequence_frame)
 
     def send_sequence_frame(self):
-        global LINK_DATA
-
         # set/fetch the current frame in the sequence
         current_frame = ensure_current_frame(LINK_DATA.sequence_current_frame)
-        update_link_status(f"Sequence Frame: {current_frame}")
+        update_link_status(f"Sequence Frame: {current_frame}", throttle=True)
         # force recalculate all transforms
         bpy.context.view_layer.update()
         # send current sequence frame pose
@@ -2117,11 +2599,10 @@ class LinkService():
         self.send(OpCodes.SEQUENCE_END, sequence_data)
         # clear the actors
         self.restore_actor_rigs(LINK_DATA.sequence_actors)
-        LINK_DATA.sequence_actors = None
+        LINK_DATA.set_sequence_actors(None)
         LINK_DATA.sequence_type = None
 
     def send_sequence_ack(self, frame):
-        global LINK_DATA
         # encode sequence ack
         data = encode_from_json({
             "frame": BFA(frame),
@@ -2130,22 +2611,17 @@ class LinkService():
         # send sequence ack
         self.send(OpCodes.SEQUENCE_ACK, data)
 
-    def decode_pose_frame_header(self, pose_data):
-        count, frame = struct.unpack_from("!II", pose_data)
-        frame = RLFA(frame)
-        LINK_DATA.sequence_current_frame = frame
-        return frame
-
     def decode_pose_frame_data(self, pose_data):
-        global LINK_DATA
+        """Decodes the pose frame into the actors' datalink rigs and shape keys, returns the frame and actors."""
         prefs = vars.prefs()
 
         offset = 0
-        count, frame = struct.unpack_from("!II", pose_data, offset)
+        count, frame = HEADER_STRUCT.unpack_from(pose_data, offset)
         frame = RLFA(frame)
-        ensure_current_frame(frame)
+        if not (DEFERRED_FRAME_UPDATE and LINK_DATA.sequence_type == "SEQUENCE" and not prefs.datalink_frame_sync):
+            ensure_current_frame(frame)
         LINK_DATA.sequence_current_frame = frame
-        offset = 8
+        offset = HEADER_STRUCT.size
         actors = []
         for i in range(0, count):
             offset, name = unpack_string(pose_data, offset)
@@ -2163,65 +2639,49 @@ class LinkService():
                 rig = None
                 is_prop = False
 
-            # unpack rig transform
-            tx,ty,tz,rx,ry,rz,rw,sx,sy,sz = struct.unpack_from("!ffffffffff", pose_data, offset)
-            offset += 40
+            # skip the rig transform (the rig is kept at the origin)
+            offset += TRANSFORM_STRUCT.size
             if rig:
-                loc = Vector((tx, ty, tz)) * 0.01
-                rot = Quaternion((rw, rx, ry, rz))
-                sca = Vector((sx, sy, sz))
-                #
-                rig.location = Vector((0, 0, 0))
-                rot_mode = rig.rotation_mode
-                rig.rotation_mode = "QUATERNION"
-                rig.rotation_quaternion = Quaternion((1, 0, 0, 0))
-                if actor.get_chr_cache().rigified:
-                    rig.scale = Vector((1, 1, 1))
-                else:
-                    rig.scale = Vector((0.01, 0.01, 0.01))
-                rig.rotation_mode = rot_mode
+                # only write the reset when the rig has actually moved, as every transform write
+                # tags the rig (and all its children) for re-evaluation
+                rig_scale = Vector((1, 1, 1)) if actor.get_chr_cache().rigified else Vector((0.01, 0.01, 0.01))
+                if rig.location.length_squared > 0:
+                    rig.location = Vector((0, 0, 0))
+                # (reset the rotation of whichever rotation mode the rig is in)
+                if rig.rotation_mode == "QUATERNION":
+                    if tuple(rig.rotation_quaternion) != (1, 0, 0, 0):
+                        rig.rotation_quaternion = Quaternion((1, 0, 0, 0))
+                elif rig.rotation_mode == "AXIS_ANGLE":
+                    if tuple(rig.rotation_axis_angle) != (0, 0, 1, 0):
+                        rig.rotation_axis_angle = (0, 0, 1, 0)
+                elif rig.rotation_euler.to_tuple() != (0, 0, 0):
+                    rig.rotation_euler = (0, 0, 0)
+                if (rig.scale - rig_scale).length_squared > 1e-12:
+                    rig.scale = rig_scale
 
             datalink_rig = None
             if actor:
                 if actor_ready:
                     actors.append(actor)
-                    datalink_rig = make_datalink_import_rig(actor)
+                    datalink_rig = actor.get_datalink_rig()
                 else:
                     utils.log_error(f"Actor not ready: {name}/ {link_id}")
             else:
                 utils.log_error(f"Could not find actor: {name}/ {link_id}")
 
-            # unpack bone transforms
-            num_bones = struct.unpack_from("!I", pose_data, offset)[0]
-            offset += 4
-
-            # unpack the binary transform data directly into the datalink rig pose bones
-            for i in range(0, num_bones):
-                tx,ty,tz,rx,ry,rz,rw,sx,sy,sz = struct.unpack_from("!ffffffffff", pose_data, offset)
-                offset += 40
-                if actor and datalink_rig:
-                    bone_name = actor.rig_bones[i]
-                    pose_bone: bpy.types.PoseBone = datalink_rig.pose.bones[bone_name]
-                    loc = Vector((tx, ty, tz)) * 0.01
-                    rot = Quaternion((rw, rx, ry, rz))
-                    sca = Vector((sx, sy, sz))
-                    rot_mode = pose_bone.rotation_mode
-                    pose_bone.rotation_mode = "QUATERNION"
-                    pose_bone.rotation_quaternion = rot
-                    pose_bone.location = loc
-                    pose_bone.scale = sca
-                    pose_bone.rotation_mode = rot_mode
-
-
-            # unpack mesh transforms
-            num_meshes = struct.unpack_from("!I", pose_data, offset)[0]
-            offset += 4
-
-            # unpack the binary transform data directly into the mesh transform
-            for i in range(0, num_meshes):
-                tx,ty,tz,rx,ry,rz,rw,sx,sy,sz = struct.unpack_from("!ffffffffff", pose_data, offset)
-                offset += 40
-                if actor and datalink_rig:
+            # unpack the bone and mesh transforms and the expression and viseme weights
+            layout = actor.pose_frame_layout if actor else None
+            offset, bone_data, mesh_data, expression_weights, viseme_weights = \
+                unpack_pose_frame_blocks(pose_data, offset, layout)
+
+            # write the bone transforms directly into the datalink rig pose bones
+            if actor and datalink_rig:
+                set_pose_bone_transforms(datalink_rig, actor.datalink_bone_indices, bone_data)
+
+
+            # store the mesh transforms
+            if actor and datalink_rig:
+                for i, (tx,ty,tz,rx,ry,rz,rw,sx,sy,sz) in enumerate(mesh_data.tolist()):
                     mesh_name = actor.meshes[i]
                     if mesh_name in actor.skin_meshes:
                         obj = actor.skin_meshes[mesh_name][0]
@@ -2230,29 +2690,28 @@ class LinkService():
                         actor.skin_meshes[mesh_name][3] = Vector((sx, sy, sz))
 
 
-            # unpack the expression shape keys into the mesh objects
-            num_weights = struct.unpack_from("!I", pose_data, offset)[0]
-            offset += 4
-            expression_weights = [0] * num_weights
-            for i in range(0, num_weights):
-                weight = struct.unpack_from("!f", pose_data, offset)[0]
-                offset += 4
-                if actor and objects and prefs.datalink_preview_shape_keys:
-                    expression_name = actor.expressions[i]
-                    set_actor_expression_weight(objects, expression_name, weight)
-                expression_weights[i] = weight
-
-            # unpack the viseme shape keys into the mesh objects
-            num_weights = struct.unpack_from("!I", pose_data, offset)[0]
-            offset += 4
-            viseme_weights = [0] * num_weights
-            for i in range(0, num_weights):
-                weight = struct.unpack_from("!f", pose_data, offset)[0]
-                offset += 4
-                if actor and objects and prefs.datalink_preview_shape_keys:
-                    viseme_name = actor.visemes[i]
-                    set_actor_viseme_weight(objects, viseme_name, weight)
-                viseme_weights[i] = weight
+            # shape key targets to preview the weights on
+            expression_targets = None
+            viseme_targets = None
+            if actor and objects and prefs.datalink_preview_shape_keys and LINK_DATA.preview_shape_keys:
+                if actor.cache:
+                    expression_targets = actor.cache["expression_targets"]
+                    viseme_targets = actor.cache["viseme_targets"]
+                else:
+                    expression_targets = get_shape_key_targets(objects, actor.expressions)
+                    viseme_targets = get_shape_key_targets(objects, actor.visemes)
+
+            # set the expression shape keys in the mesh objects
+            expression_weights = expression_weights.tolist()
+            if expression_targets:
+                for i, weight in enumerate(expression_weights):
+                    set_shape_key_target_weight(expression_targets[i], weight)
+
+            # set the viseme shape keys in the mesh objects
+            viseme_weights = viseme_weights.tolist()
+            if viseme_targets:
+                for i, weight in enumerate(viseme_weights):
+                    set_shape_key_target_weight(viseme_targets[i], weight)
 
             # TODO: morph weights
             morph_weights = []
@@ -2261,7 +2720,7 @@ class LinkService():
             if actor_ready:
                 store_shape_key_cache_keyframes(actor, frame, expression_weights, viseme_weights, morph_weights)
 
-        return actors
+        return frame, actors
 
     def reposition_prop_meshes(self, actors):
         actor: LinkActor
@@ -2275,11 +2734,13 @@ class LinkService():
                 if mod: continue
                 obj.matrix_world = utils.make_transform_matrix(loc, rot, rig.scale)
 
-    def find_link_id(self, link_id: str):
+    def get_link_id_index(self):
+        """Returns a link_id -> object dictionary of all the objects with a link_id."""
+        link_id_index = {}
         for obj in bpy.data.objects:
-            if "link_id" in obj and obj["link_id"] == link_id:
-                return obj
-        return None
+            if "link_id" in obj:
+                link_id_index.setdefault(obj["link_id"], obj)
+        return link_id_index
 
     def add_spot_light(self, name, container):
         bpy.ops.object.light_add(type="SPOT")
@@ -2352,6 +2813,7 @@ class LinkService():
         utils.object_mode()
 
         container = self.add_light_container()
+        link_id_index = self.get_link_id_index()
 
         for light_data in lights_data["lights"]:
             light_type = light_data["type"]
@@ -2364,8 +2826,9 @@ class LinkService():
             if RECTANGULAR_AS_AREA and is_rectangle:
                 light_type = "AREA"
 
-            light = self.find_link_id(light_data["link_id"])
+            light = link_id_index.get(light_data["link_id"])
             if light and (light.type != "LIGHT" or light.data.type != light_type):
+                link_id_index.pop(light_data["link_id"])
                 utils.delete_light_object(light)
                 light = None
             if not light:
@@ -2378,8 +2841,9 @@ class LinkService():
                 else:
                     light = self.add_spot_light(light_data["name"], container)
                 light["link_id"] = light_data["link_id"]
+                link_id_index[light_data["link_id"]] = light
 
-            loc = utils.array_to_vector(light_data["loc"]) / 100
+            loc = utils.array_to_vector_scaled(light_data["loc"], 0.01)
             light.location = loc
             rot_mode = light.rotation_mode
             light.rotation_mode = "QUATERNION"
@@ -2457,10 +2921,11 @@ class LinkService():
             utils.hide(light, not light_data["active"])
 
         # clean up lights not found in scene
-        for obj in bpy.data.objects:
-            if obj.type == "LIGHT":
-               if "link_id" in obj and obj["link_id"] not in lights_data["scene_lights"]:
-                   utils.delete_light_object(obj)
+        scene_lights = set(lights_data["scene_lights"])
+        stale_lights = [ obj for obj in bpy.data.objects
+                            if obj.type == "LIGHT" and "link_id" in obj and obj["link_id"] not in scene_lights ]
+        for obj in stale_lights:
+            utils.delete_light_object(obj)
         #
         bpy.context.scene.eevee.use_taa_reprojection = True
         if utils.B420():
@@ -2515,7 +2980,7 @@ class LinkService():
         if use_ibl:
             ibl_path = lights_data.get("ibl_path", "")
             ibl_strength = lights_data.get("ibl_strength", 0.5)
-            ibl_location = utils.array_to_vector(lights_data.get("ibl_location", [0,0,0])) / 100
+            ibl_location = utils.array_to_vector_scaled(lights_data.get("ibl_location", [0,0,0]), 0.01)
             ibl_rotation = utils.array_to_vector(lights_data.get("ibl_rotation", [0,0,0]))
             ibl_scale = lights_data.get("ibl_scale", 1.0)
             if ibl_path:
@@ -2526,7 +2991,7 @@ class LinkService():
 
     def receive_lights(self, data):
         props = vars.props()
-        update_link_status(f"Light Data Receveived")
+        update_link_status("Light Data Receveived")
         state = utils.store_mode_selection_state()
         props.lighting_brightness = 1.0
         self.decode_lights_data(data)
@@ -2536,10 +3001,9 @@ class LinkService():
     # Camera
     #
 
-    def get_view_camera_data(self):
-        view_space: bpy.types.Space
-        r3d: bpy.types.RegionView3D
-        view_space, r3d = utils.get_region_3d()
+    def get_view_camera_data(self, view_space: bpy.types.Space = None, r3d: bpy.types.RegionView3D = None):
+        if not r3d:
+            view_space, r3d = utils.get_region_3d()
         t = r3d.view_location
         r = r3d.view_rotation
         d = r3d.view_distance
@@ -2547,43 +3011,50 @@ class LinkService():
         dir.rotate(r)
         loc: Vector = t - (dir * d)
         lens = view_space.lens
+        # (read all the components in one go, the rotation is sent as x,y,z,w)
+        rw, rx, ry, rz = r
         data = {
             "link_id": "0",
             "name": "Viewport Camera",
-            "loc": [loc.x, loc.y, loc.z],
-            "rot": [r.x, r.y, r.z, r.w],
+            "loc": list(loc),
+            "rot": [rx, ry, rz, rw],
             "sca": [1, 1, 1],
             "focal_length": lens,
         }
         return data
 
-    def get_view_camera_pivot(self):
-        view_space, r3d = utils.get_region_3d()
+    def get_view_camera_pivot(self, r3d: bpy.types.RegionView3D = None):
+        if not r3d:
+            view_space, r3d = utils.get_region_3d()
         t = r3d.view_location
         return t
 
     def send_camera_sync(self):
         #
-        update_link_status(f"Synchronizing View Camera")
-        self.send_notify(f"Sync View Camera")
-        camera_data = self.get_view_camera_data()
-        pivot = self.get_view_camera_pivot()
+        update_link_status("Synchronizing View Camera")
+        self.send_notify("Sync View Camera")
+        # find the 3D view region once for both the camera and the pivot
+        view_space, r3d = utils.get_region_3d()
+        camera_data = self.get_view_camera_data(view_space, r3d)
+        pivot = self.get_view_camera_pivot(r3d)
         data = {
             "view_camera": camera_data,
-            "pivot": [pivot.x, pivot.y, pivot.z],
+            "pivot": list(pivot),
         }
         self.send(OpCodes.CAMERA_SYNC, encode_from_json(data))
 
     def decode_camera_sync_data(self, data):
         data = decode_to_json(data)
         camera_data = data["view_camera"]
-        pivot = utils.array_to_vector(data["pivot"]) / 100
+        pivot = utils.array_to_vector_scaled(data["pivot"], 0.01)
         view_space, r3d = utils.get_region_3d()
-        loc = utils.array_to_vector(camera_data["loc"]) / 100
-        rot = utils.array_to_quaternion(camera_data["rot"])
+        loc = utils.array_to_vector_scaled(camera_data["loc"], 0.01)
+        # (the rotation is received as x,y,z,w)
+        qx, qy, qz, qw = camera_data["rot"]
+        rot = Quaternion((qw, qx, qy, qz))
         to_pivot = pivot - loc
-        dir = Vector((0,0,-1))
-        dir.rotate(rot)
+        # view direction: (0,0,-1) rotated by the (unit) quaternion, in closed form
+        dir = Vector((-2 * (qx * qz + qw * qy), -2 * (qy * qz - qw * qx), 2 * (qx * qx + qy * qy) - 1))
         dist = to_pivot.dot(dir)
         if dist <= 0:
             dist = 1.0
@@ -2593,11 +3064,11 @@ class LinkService():
         view_space.lens = camera_data["focal_length"] * 1.625
 
     def receive_camera_sync(self, data):
-        update_link_status(f"Camera Data Receveived")
+        update_link_status("Camera Data Receveived")
         self.decode_camera_sync_data(data)
 
     def send_frame_sync(self):
-        update_link_status(f"Sending Frame Sync")
+        update_link_status("Sending Frame Sync")
         fps = bpy.context.scene.render.fps
         start_frame = BFA(bpy.context.scene.frame_start)
         end_frame = BFA(bpy.context.scene.frame_end)
@@ -2617,14 +3088,14 @@ class LinkService():
         self.send(OpCodes.FRAME_SYNC, encode_from_json(frame_data))
 
     def receive_frame_sync(self, data):
-        update_link_status(f"Frame Sync Receveived")
+        update_link_status("Frame Sync Receveived")
         frame_data = decode_to_json(data)
         start_frame = frame_data["start_frame"]
         end_frame = frame_data["end_frame"]
         current_frame = frame_data["current_frame"]
         bpy.context.scene.frame_start = RLFA(start_frame)
         bpy.context.scene.frame_end = RLFA(end_frame)
-        bpy.context.scene.frame_current = RLFA(current_frame)
+        ensure_current_frame(RLFA(current_frame))
 
 
     # Character Pose
@@ -2632,7 +3103,6 @@ class LinkService():
 
     def receive_character_template(self, data):
         props = vars.props()
-        global LINK_DATA
 
         state = utils.store_mode_selection_state()
 
@@ -2660,7 +3130,7 @@ class LinkService():
             else:
                 utils.log_error(f"Unable to find actor: {name} ({link_id})")
 
-        update_link_status(f"Character Templates Received")
+        update_link_status("Character Templates Received")
         utils.restore_mode_selection_state(state)
 
     def select_actor_rigs(self, actors, start_frame=0, end_frame=0):
@@ -2672,13 +3142,12 @@ class LinkService():
                 rigs.append(rig)
         if rigs:
             all_selected = True
-            if not (utils.get_mode() == "POSE" and len(bpy.context.selected_objects) == len(rigs)):
+            selected_objects = bpy.context.selected_objects
+            if not (utils.get_mode() == "POSE" and len(selected_objects) == len(rigs)):
                 all_selected = False
             else:
-                for rig in rigs:
-                    if rig not in bpy.context.selected_objects:
-                        all_selected = False
-                        break
+                selected = set(selected_objects)
+                all_selected = all(rig in selected for rig in rigs)
             if not all_selected:
                 utils.object_mode()
                 utils.clear_selected_objects()
@@ -2688,7 +3157,6 @@ class LinkService():
 
     def receive_pose(self, data):
         props = vars.props()
-        global LINK_DATA
 
         props.validate_and_clean_up()
 
@@ -2718,21 +3186,19 @@ class LinkService():
 
         # set pose frame
         update_link_status(f"Receiving Pose Frame: {frame}")
-        LINK_DATA.sequence_actors = actors
+        LINK_DATA.set_sequence_actors(actors)
         LINK_DATA.sequence_type = "POSE"
         bpy.ops.screen.animation_cancel()
         set_frame_range(start_frame, end_frame)
-        set_frame(frame)
+        # the pose frame follows and evaluates the pose
+        set_frame(frame, update=False)
 
     def receive_pose_frame(self, data):
-        global LINK_DATA
-
         state = utils.store_mode_selection_state()
 
         # decode and cache pose
-        frame = self.decode_pose_frame_header(data)
-        utils.log_info(f"Receive Pose Frame: {frame}")
-        actors = self.decode_pose_frame_data(data)
+        frame, actors = self.decode_pose_frame_data(data)
+        utils.log_info("Receive Pose Frame: %s", frame)
 
         # force recalculate all transforms
         bpy.context.view_layer.update()
@@ -2762,14 +3228,14 @@ class LinkService():
                     rigutils.update_avatar_rig(rig)
 
         # finish
-        LINK_DATA.sequence_actors = None
+        LINK_DATA.set_sequence_actors(None)
         LINK_DATA.sequence_type = None
-        bpy.context.scene.frame_current = frame
+        # (the decode has usually already moved the scene to this frame)
+        ensure_current_frame(frame)
         utils.restore_mode_selection_state(state)
 
     def receive_sequence(self, data):
         props = vars.props()
-        global LINK_DATA
 
         props.validate_and_clean_up()
 
@@ -2796,45 +3262,45 @@ class LinkService():
             actor = LinkActor.find_actor(link_id, search_name=name, search_type=character_type)
             if actor:
                 actors.append(actor)
-        LINK_DATA.sequence_actors = actors
+        LINK_DATA.set_sequence_actors(actors)
         LINK_DATA.sequence_type = "SEQUENCE"
 
         # update scene range
         update_link_status(f"Receiving Live Sequence: {num_frames} frames")
         bpy.ops.screen.animation_cancel()
         set_frame_range(LINK_DATA.sequence_start_frame, LINK_DATA.sequence_end_frame)
-        set_frame(LINK_DATA.sequence_start_frame)
+        # the first sequence frame drives the evaluation
+        set_frame(LINK_DATA.sequence_start_frame, update=False)
 
         # start the sequence
         self.start_sequence()
 
     def receive_sequence_frame(self, data):
-        global LINK_DATA
-
         # decode and cache pose
-        frame = self.decode_pose_frame_header(data)
-        utils.log_detail(f"Receive Sequence Frame: {frame}")
-        actors = self.decode_pose_frame_data(data)
+        frame, actors = self.decode_pose_frame_data(data)
+        utils.log_detail("Receive Sequence Frame: %s", frame)
 
-        # force recalculate all transforms
-        bpy.context.view_layer.update()
+        # (only ready actors are returned, with none there is nothing to evaluate or store)
+        if actors:
+            # recalculate the transforms: the character rigs follow the datalink rigs through constraints
+            # and the pose bone matrices are only valid after evaluation. Only the rigs tagged by the
+            # pose frame and their dependents are re-evaluated.
+            bpy.context.view_layer.update()
 
-        self.reposition_prop_meshes(actors)
+            self.reposition_prop_meshes(actors)
 
-        # store frame data
-        update_link_status(f"Sequence Frame: {LINK_DATA.sequence_current_frame}")
-        rigs = self.select_actor_rigs(actors)
-        if rigs:
-            for actor in actors:
-                if actor.ready():
-                    store_bone_cache_keyframes(actor, frame)
+            # store frame data
+            rigs = self.select_actor_rigs(actors)
+            if rigs:
+                for actor in actors:
+                    if actor.ready():
+                        store_bone_cache_keyframes(actor, frame)
+        update_link_status(f"Sequence Frame: {LINK_DATA.sequence_current_frame}", throttle=True)
 
         # send sequence frame ack
         self.send_sequence_ack(frame)
 
     def receive_sequence_end(self, data):
-        global LINK_DATA
-
         # decode sequence end
         json_data = decode_to_json(data)
         actors_data = json_data["actors"]
@@ -2846,10 +3312,7 @@ class LinkService():
         actors = []
         actor: LinkActor
         for actor_data in actors_data:
-            name = actor_data["name"]
-            character_type = actor_data["type"]
-            link_id = actor_data["link_id"]
-            actor = LINK_DATA.find_sequence_actor(link_id)
+            actor = LINK_DATA.find_sequence_actor(actor_data["link_id"])
             if actor:
                 actors.append(actor)
         num_frames = LINK_DATA.sequence_end_frame - LINK_DATA.sequence_start_frame + 1
@@ -2868,16 +3331,15 @@ class LinkService():
 
         # stop sequence
         self.stop_sequence()
-        LINK_DATA.sequence_actors = None
+        LINK_DATA.set_sequence_actors(None)
         LINK_DATA.sequence_type = None
-        bpy.context.scene.frame_current = LINK_DATA.sequence_start_frame
+        ensure_current_frame(LINK_DATA.sequence_start_frame)
 
         # play the recorded sequence
         bpy.ops.screen.animation_play()
 
     def receive_sequence_ack(self, data):
         prefs = vars.prefs()
-        global LINK_DATA
 
         json_data = decode_to_json(data)
         ack_frame = RLFA(json_data["frame"])
@@ -2910,8 +3372,6 @@ class LinkService():
 
     def receive_character_import(self, data):
         props = vars.props()
-        prefs = vars.prefs()
-        global LINK_DATA
 
         props.validate_and_clean_up()
 
@@ -2928,8 +3388,14 @@ class LinkService():
 
         utils.log_info(f"Receive Character Import: {name} / {link_id} / {fbx_path}")
 
+        # check the path and import after the service loop has returned
+        run_deferred(self.deferred_character_import, fbx_path, name, character_type, link_id, save_after_import)
+
+    def deferred_character_import(self, fbx_path, name, character_type, link_id, save_after_import):
+        prefs = vars.prefs()
+
         if not os.path.exists(fbx_path):
-            update_link_status(f"Invalid Import Path!")
+            update_link_status("Invalid Import Path!")
             return
 
         actor = LinkActor.find_actor(link_id, search_name=name, search_type=character_type)
@@ -2980,7 +3446,6 @@ class LinkService():
     def receive_motion_import(self, data):
         props = vars.props()
         prefs = vars.prefs()
-        global LINK_DATA
 
         props.validate_and_clean_up()
 
@@ -3006,7 +3471,7 @@ class LinkService():
         # update scene range
         bpy.ops.screen.animation_cancel()
         set_frame_range(LINK_DATA.sequence_start_frame, LINK_DATA.sequence_end_frame)
-        set_frame(LINK_DATA.sequence_start_frame)
+        set_frame(LINK_DATA.sequence_start_frame, update=False)
         bpy.context.scene.frame_current = frame
 
         actor = LinkActor.find_actor(link_id, search_name=name, search_type=character_type)
@@ -3039,7 +3504,7 @@ class LinkService():
         update_link_status(f"Receving Motion Import: {actor.name}")
 
         if actor.get_type() != character_type:
-            update_link_status(f"Invalid character type for motion!")
+            update_link_status("Invalid character type for motion!")
             return
 
         if os.path.exists(fbx_path):
@@ -3067,7 +3532,7 @@ class LinkService():
             motion_rig_action = utils.safe_get_action(motion_rig)
             motion_objects = utils.get_child_objects(motion_rig)
             motion_id = rigutils.get_action_motion_id(motion_rig_action)
-            utils.log_info(f"Replacing Actor Motion:")
+            utils.log_info("Replacing Actor Motion:")
             utils.log_indent()
             utils.log_info(f"Motion rig action: {motion_rig_action.name}")
             # fetch all associated actions...
@@ -3089,7 +3554,7 @@ class LinkService():
                     if prefs.datalink_retarget_prop_actions:
                         action = get_datalink_rig_action(actor_rig, motion_id)
                         rigutils.add_motion_set_data(action, set_id, set_generation, rl_arm_id=rl_arm_id)
-                        update_link_status(f"Retargeting Motion...")
+                        update_link_status("Retargeting Motion...")
                         armature_action = rigutils.bake_rig_action_from_source(motion_rig, actor_rig)
                         armature_action.use_fake_user = LINK_DATA.use_fake_user
                         remove_actions.append(motion_rig_action)
@@ -3102,7 +3567,7 @@ class LinkService():
                     rigutils.update_prop_rig(actor_rig)
                 else: # Avatar
                     if chr_cache.rigified:
-                        update_link_status(f"Retargeting Motion...")
+                        update_link_status("Retargeting Motion...")
                         armature_action = rigging.adv_bake_retarget_to_rigify(None, chr_cache, motion_rig, motion_rig_action)[0]
                         armature_action.use_fake_user = LINK_DATA.use_fake_user
                         rigutils.add_motion_set_data(armature_action, set_id, set_generation, rl_arm_id=rl_arm_id)
@@ -3141,7 +3606,6 @@ class LinkService():
 
     def receive_actor_update(self, data):
         props = vars.props()
-        global LINK_DATA
 
         props.validate_and_clean_up()
 
@@ -3160,9 +3624,11 @@ class LinkService():
         actor.update_name(new_name)
         actor.update_link_id(new_link_id)
 
+    def receive_morph_update(self, data):
+        self.receive_morph(data, update=True)
+
     def receive_morph(self, data, update=False):
         props = vars.props()
-        global LINK_DATA
 
         props.validate_and_clean_up()
 
@@ -3174,6 +3640,10 @@ class LinkService():
         link_id = json_data["link_id"]
         utils.log_info(f"Receive Character Morph: {name} / {link_id} / {obj_path}")
 
+        # check the path and import after the service loop has returned
+        run_deferred(self.deferred_morph, obj_path, name, character_type, link_id)
+
+    def deferred_morph(self, obj_path, name, character_type, link_id):
         # fetch actor to update morph or import new morph character
         actor = LinkActor.find_actor(link_id, search_name=name, search_type=character_type)
         if actor:
@@ -3183,7 +3653,7 @@ class LinkService():
         if actor:
             chr_cache = actor.get_chr_cache()
             if not chr_cache.is_import_type("OBJ"):
-                update_link_status(f"Character is not for Morph editing!")
+                update_link_status("Character is not for Morph editing!")
                 return
         update_link_status(f"Receving Character Morph: {name}")
         if os.path.exists(obj_path):
@@ -3228,7 +3698,6 @@ class LinkService():
 
     def do_update_replace(self, name, link_id, fbx_path, character_type, replace_all, objects_to_replace_names=None, replace_actions=False):
         props = vars.props()
-        global LINK_DATA
         context_chr_cache = props.get_context_character_cache()
 
         process_only = ""
@@ -3262,7 +3731,7 @@ class LinkService():
         # can happen if the link_id's don't match
         if chr_cache == temp_chr_cache:
             utils.log_error("Character replacement and original are the same!")
-            update_link_status(f"Error! Character Mismatch")
+            update_link_status("Error! Character Mismatch")
             temp_chr_cache.invalidate()
             temp_chr_cache.delete()
             return
@@ -3505,15 +3974,16 @@ class LinkService():
 
 
 LINK_SERVICE: LinkService = None
+LINK_STATUS_REDRAW_TIME: float = 0.0
+# local data paths that already have their import and export folders
+PREPPED_DATA_PATHS: set = set()
 
 
 def get_link_service():
-    global LINK_SERVICE
     return LINK_SERVICE
 
 
 def link_state_update():
-    global LINK_SERVICE
     if LINK_SERVICE:
         link_props = vars.link_props()
         link_props.link_listening = LINK_SERVICE.is_listening
@@ -3522,14 +3992,21 @@ def link_state_update():
         utils.update_ui()
 
 
-def update_link_status(text):
+def update_link_status(text, throttle=False):
+    """Sets the link status text and redraws the UI.
+       throttle: for status updates every frame, only redraw every STATUS_REDRAW_INTERVAL seconds."""
+    global LINK_STATUS_REDRAW_TIME
     link_props = vars.link_props()
     link_props.link_status = text
+    if throttle:
+        current_time = time.monotonic()
+        if current_time - LINK_STATUS_REDRAW_TIME < STATUS_REDRAW_INTERVAL:
+            return
+        LINK_STATUS_REDRAW_TIME = current_time
     utils.update_ui()
 
 
 def reconnect():
-    global LINK_SERVICE
     link_props = vars.link_props()
     prefs = vars.prefs()
 
@@ -3560,9 +4037,11 @@ class CCICDataLink(bpy.types.Operator):
             options={"HIDDEN"}
         )
 
-    def execute(self, context):
-        global LINK_SERVICE
+    # params that need the link connected (started if not) before they can run
+    CONNECT_PARAMS = {"SEND_POSE", "SEND_ANIM", "SEND_ACTOR", "SEND_MORPH",
+                      "SEND_REPLACE_MESH", "SEND_TEXTURES", "SYNC_CAMERA"}
 
+    def execute(self, context):
         if self.param == "START":
             self.link_start()
             return {'FINISHED'}
@@ -3575,8 +4054,7 @@ class CCICDataLink(bpy.types.Operator):
             self.link_stop()
             return {'FINISHED'}
 
-        if self.param in ["SEND_POSE", "SEND_ANIM", "SEND_ACTOR", "SEND_MORPH",
-                          "SEND_REPLACE_MESH", "SEND_TEXTURES", "SYNC_CAMERA"]:
+        if self.param in self.CONNECT_PARAMS:
             if not LINK_SERVICE or not LINK_SERVICE.is_connected:
                 self.link_start()
             if not LINK_SERVICE or not (LINK_SERVICE.is_connected or LINK_SERVICE.is_connecting):
@@ -3588,38 +4066,38 @@ class CCICDataLink(bpy.types.Operator):
             if self.param == "SEND_POSE":
                 count = LINK_SERVICE.send_pose()
                 if count == 1:
-                    self.report({'INFO'}, f"Pose sent...")
+                    self.report({'INFO'}, "Pose sent...")
                 elif count > 1:
                     self.report({'INFO'}, f"{count} Poses sent...")
                 else:
-                    self.report({'ERROR'}, f"No Pose sent!")
+                    self.report({'ERROR'}, "No Pose sent!")
                 return {'FINISHED'}
 
             elif self.param == "SEND_ANIM":
                 LINK_SERVICE.send_sequence()
-                self.report({'INFO'}, f"Sequence started...")
+                self.report({'INFO'}, "Sequence started...")
                 return {'FINISHED'}
 
             elif self.param == "STOP_ANIM":
                 LINK_SERVICE.abort_sequence()
-                self.report({'INFO'}, f"Sequence stopped!")
+                self.report({'INFO'}, "Sequence stopped!")
                 return {'FINISHED'}
 
             elif self.param == "SEND_ACTOR":
                 count = LINK_SERVICE.send_actor()
                 if count == 1:
-                    self.report({'INFO'}, f"Actor sent...")
+                    self.report({'INFO'}, "Actor sent...")
                 elif count > 1:
                     self.report({'INFO'}, f"{count} Actors sent...")
                 else:
-                    self.report({'ERROR'}, f"No Actors sent!")
+                    self.report({'ERROR'}, "No Actors sent!")
                 return {'FINISHED'}
 
             elif self.param == "SEND_MORPH":
                 if LINK_SERVICE.send_morph():
-                    self.report({'INFO'}, f"Morph sent...")
+                    self.report({'INFO'}, "Morph sent...")
                 else:
-                    self.report({'ERROR'}, f"Morph not sent!")
+                    self.report({'ERROR'}, "Morph not sent!")
                 return {'FINISHED'}
 
             elif self.param == "SYNC_CAMERA":
@@ -3629,21 +4107,21 @@ class CCICDataLink(bpy.types.Operator):
             elif self.param == "SEND_REPLACE_MESH":
                 count = LINK_SERVICE.send_replace_mesh()
                 if count == 1:
-                    self.report({'INFO'}, f"Replace Mesh sent...")
+                    self.report({'INFO'}, "Replace Mesh sent...")
                 elif count > 1:
                     self.report({'INFO'}, f"{count} Replace Meshes sent...")
                 else:
-                    self.report({'ERROR'}, f"No Replace Meshes sent!")
+                    self.report({'ERROR'}, "No Replace Meshes sent!")
                 return {'FINISHED'}
 
             elif self.param == "SEND_MATERIAL_UPDATE":
                 count = LINK_SERVICE.send_material_update(context)
                 if count == 1:
-                    self.report({'INFO'}, f"Material sent...")
+                    self.report({'INFO'}, "Material sent...")
                 elif count > 1:
                     self.report({'INFO'}, f"{count} Materials sent...")
                 else:
-                    self.report({'ERROR'}, f"No Materials sent!")
+                    self.report({'ERROR'}, "No Materials sent!")
                 return {'FINISHED'}
 
             elif self.param == "DEPIVOT":
@@ -3678,12 +4156,13 @@ class CCICDataLink(bpy.types.Operator):
 
     def prep_local_files(self):
         data_path = get_local_data_path()
-        if data_path:
+        if data_path and data_path not in PREPPED_DATA_PATHS:
             os.makedirs(data_path, exist_ok=True)
             import_path = os.path.join(data_path, "imports")
             export_path = os.path.join(data_path, "exports")
             os.makedirs(import_path, exist_ok=True)
             os.makedirs(export_path, exist_ok=True)
+            PREPPED_DATA_PATHS.add(data_path)
 
     def link_start(self, is_go_b=False):
         link_props = vars.link_props()
@@ -3698,20 +4177,15 @@ class CCICDataLink(bpy.types.Operator):
             LINK_SERVICE.service_start(link_props.link_host_ip, link_props.link_port)
 
     def link_stop(self):
-        global LINK_SERVICE
-
         if LINK_SERVICE:
             LINK_SERVICE.service_stop()
 
     def link_disconnect(self):
-        global LINK_SERVICE
-
         if LINK_SERVICE:
             LINK_SERVICE.service_disconnect()
 
     @classmethod
     def description(cls, context, properties):
-
         if properties.param == "START":
             return "Attempt to start the DataLink by connecting to the server running on CC4/iC8"
 
@@ -3809,7 +4283,6 @@ class CCICLinkConfirmDialog(bpy.types.Operator):
     wrap_width = width / 5.5
 
     def execute(self, context):
-        global LINK_SERVICE
         props = vars.props()
         prefs = vars.prefs()
 
@@ -829,6 +829,15 @@ def find_node_by_image(nodes, image):
     return None
 
 
+def index_nodes_by_type(nodes):
+    """Returns the nodes grouped in lists by node type, so repeated find_node_by_type_and_keywords
+       lookups on the same node tree only search the nodes of that type: index.get(type, [])"""
+    index = {}
+    for node in nodes:
+        index.setdefault(node.type, []).append(node)
+    return index
+
+
 def find_node_by_type_and_keywords(nodes, type, *keywords):
     for node in nodes:
         if node.type == type:
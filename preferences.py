@@ -139,6 +139,8 @@ def reset_preferences():
     prefs.build_shape_key_bone_drivers_head = False
     prefs.build_body_key_drivers = False
     prefs.bake_use_gpu = False
+    prefs.bake_ao_samples = 512
+    prefs.bake_ao_adaptive_threshold = 0.1
     prefs.build_armature_edit_modifier = True
     prefs.build_armature_preserve_volume = False
     prefs.physics_weightmap_curve = 5.0
@@ -425,6 +427,10 @@ class CC3ToolsAddonPreferences(bpy.types.AddonPreferences):
                     ], default="AgX", name="Color management display space", update=set_view_transform)
 
     bake_use_gpu: bpy.props.BoolProperty(default=False, description="Bake on the GPU for faster more accurate baking.", name="GPU Bake")
+    bake_ao_samples: bpy.props.IntProperty(default=512, min=16, max=4096, name="GPU AO Bake Samples",
+                                           description="Maximum number of samples for the GPU sculpt layer AO bake. As the AO only overlays low frequency occlusion, a few hundred samples is usually enough")
+    bake_ao_adaptive_threshold: bpy.props.FloatProperty(default=0.1, min=0.001, max=0.5, precision=3, name="GPU AO Bake Noise Threshold",
+                                                        description="Adaptive sampling noise threshold for the GPU sculpt layer AO bake. Converged pixels stop sampling early, so higher thresholds bake faster")
     bake_objects_mode: bpy.props.EnumProperty(items=[
                         ("ALL","All","Bake all character objects"),
                         ("SELECTED","Selected","Bake only selected characeter objects"),
@@ -571,6 +577,8 @@ class CC3ToolsAddonPreferences(bpy.types.AddonPreferences):
         layout.label(text="Rendering:")
         layout.prop(self, "render_target")
         layout.prop(self, "bake_use_gpu")
+        layout.prop(self, "bake_ao_samples")
+        layout.prop(self, "bake_ao_adaptive_threshold")
 
         if colorspace.is_aces():
             layout.label(text="OpenColorIO ACES")
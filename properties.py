@@ -22,6 +22,10 @@ from . import (channel_mixer, imageutils, meshutils, sculpting, materials,
                params, physics, basic, jsonutils, utils, vars)
 from .drivers import get_head_body_object_quick
 
+# link_id -> last known index of the character in props.import_cache
+# (an index rather than the chr_cache itself, as collection items move when the collection changes)
+LINK_ID_INDEX = {}
+
 
 def open_mouth_update(self, context):
     props: CC3ImportProps = vars.props()
@@ -2956,8 +2960,15 @@ class CC3ImportProps(bpy.types.PropertyGroup):
 
     def find_character_by_link_id(self, link_id):
         if link_id:
-            for chr_cache in self.import_cache:
+            # try the last known index first
+            index = LINK_ID_INDEX.get(link_id, -1)
+            if 0 <= index < len(self.import_cache):
+                chr_cache = self.import_cache[index]
+                if not chr_cache.disabled and chr_cache.link_id == link_id:
+                    return chr_cache
+            for index, chr_cache in enumerate(self.import_cache):
                 if not chr_cache.disabled and chr_cache.link_id == link_id:
+                    LINK_ID_INDEX[link_id] = index
                     return chr_cache
         return None
 
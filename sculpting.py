@@ -34,6 +34,17 @@ LAYER_DISPLACEMENT_SUFFIX = "Layer_Displacement"
 LAYER_AO_SUFFIX = "Layer_AO"
 BAKE_FOLDER = "Sculpt Bake"
 SKINGEN_FOLDER = "Skingen"
+# (material name, layer target) -> last found layer mix node name
+LAYER_MIX_NODE_NAMES = {}
+# operator descriptions (sharing the same paragraphs)
+DETAIL_SCULPT_INFO = "Detail sculpting is done on a reduced copy of the character and sculpted normals are baked back and overlayed on the original character.\n\n"
+BODY_SCULPT_INFO = "Body sculpting is done on a reduced copy of the character (Only the Head, Body, Arms and Legs) and sculpted normals are baked back and overlayed on the original character.\n\n"
+SCULPT_WARNING = "Note: This does not make any changes to the mesh of the original character.\n\n" \
+                 "Warning: It is very important that you *do not* apply the base shape yourself in the multi-res modifier"
+DETAIL_SETUP_DESCRIPTION = "Set up and begin detail sculpting for the character.\n\n" + DETAIL_SCULPT_INFO + SCULPT_WARNING
+DETAIL_BEGIN_DESCRIPTION = "Resume detail sculpting for the character.\n\n" + DETAIL_SCULPT_INFO + SCULPT_WARNING
+BODY_SETUP_DESCRIPTION = "Set up and begin full body sculpting for the character.\n\n" + BODY_SCULPT_INFO + SCULPT_WARNING
+BODY_BEGIN_DESCRIPTION = "Resume full body sculpting for the character.\n\n" + BODY_SCULPT_INFO + SCULPT_WARNING
 
 
 def set_multi_res_level(obj, view_level = -1, sculpt_level = -1, render_level = -1):
@@ -71,6 +82,7 @@ def apply_multi_res_shape(body):
 
 
 def displacement_map_func(value):
+    # (maps the whole array of image values at once)
     return abs(value - 0.5)
 
 
@@ -117,29 +129,38 @@ def do_multires_bake(context, chr_cache, multires_mesh, layer_target, apply_shap
     # prep for baking directly onto body mesh surface
     bake_state = bake.prep_bake(context, samples=32, make_surface=False)
 
+    # find the bake image nodes for all the bake passes
+    bake_nodes = get_bake_nodes(multires_mesh, layer_target)
+
     # AO Baking (full res on body mesh)
-    select_bake_images(multires_mesh, BAKE_TYPE_AO, layer_target)
-
-    ao_body = utils.duplicate_object(multires_mesh)
-    ao_body.name = multires_mesh.name + "_AOBAKE"
-    materials.normalize_udim_uvs(ao_body)
-    utils.set_only_render_visible(ao_body)
-    utils.object_mode_to(ao_body)
-    utils.set_only_active_object(ao_body)
-    set_multi_res_level(ao_body, view_level=9, sculpt_level=9, render_level=9)
-    utils.log_info(f"Baking {layer_target} AO...")
-    bpy.context.scene.render.use_bake_multires = False
-    # *cycles* bake type to AO
-    bpy.context.scene.cycles.bake_type = "AO"
-    if prefs.bake_use_gpu:
-        bake.set_cycles_samples(context, samples=2048, adaptive_samples=0.1, time_limit=15, use_gpu=True)
+    # (the most expensive bake, so skip it if there are no AO images to bake)
+    if has_bake_images(bake_nodes, BAKE_TYPE_AO):
+        select_bake_images(bake_nodes, BAKE_TYPE_AO, layer_target)
+
+        ao_body = utils.duplicate_object_fast(multires_mesh)
+        ao_body.name = multires_mesh.name + "_AOBAKE"
+        materials.normalize_udim_uvs(ao_body)
+        utils.set_only_render_visible(ao_body)
+        utils.object_mode_to(ao_body)
+        utils.set_only_active_object(ao_body)
+        set_multi_res_level(ao_body, view_level=9, sculpt_level=9, render_level=9)
+        utils.log_info(f"Baking {layer_target} AO...")
+        bpy.context.scene.render.use_bake_multires = False
+        # *cycles* bake type to AO
+        bpy.context.scene.cycles.bake_type = "AO"
+        if prefs.bake_use_gpu and bake.enable_cycles_gpu_devices(bake_state):
+            bake.set_cycles_samples(context, samples=prefs.bake_ao_samples,
+                                    adaptive_samples=prefs.bake_ao_adaptive_threshold,
+                                    time_limit=15, use_gpu=True)
+        else:
+            bake.set_cycles_samples(context, samples=16, time_limit=30, use_gpu=False)
+        bpy.ops.object.bake(type="AO")
+        utils.delete_mesh_object(ao_body)
     else:
-        bake.set_cycles_samples(context, samples=16, time_limit=30, use_gpu=False)
-    bpy.ops.object.bake(type="AO")
-    utils.delete_mesh_object(ao_body)
+        utils.log_info(f"No {layer_target} AO bake images, skipping AO bake.")
 
     # Displacement Baking
-    select_bake_images(multires_mesh, BAKE_TYPE_DISPLACEMENT, layer_target)
+    select_bake_images(bake_nodes, BAKE_TYPE_DISPLACEMENT, layer_target)
 
     bpy.context.scene.render.use_bake_multires = True
     bake.set_cycles_samples(context, samples=2)
@@ -147,7 +168,7 @@ def do_multires_bake(context, chr_cache, multires_mesh, layer_target, apply_shap
     # copy the body for displacement baking
     utils.log_info("Duplicating body for displacement baking")
     utils.unhide(multires_mesh)
-    disp_body = utils.duplicate_object(multires_mesh)
+    disp_body = utils.duplicate_object_fast(multires_mesh)
     disp_body.name = multires_mesh.name + "_DISPBAKE"
     materials.normalize_udim_uvs(disp_body)
 
@@ -156,9 +177,13 @@ def do_multires_bake(context, chr_cache, multires_mesh, layer_target, apply_shap
     utils.log_info(f"Baking {layer_target} displacement...")
     utils.clear_selected_objects()
     utils.set_only_active_object(disp_body)
-    utils.edit_mode_to(disp_body)
-    bpy.ops.mesh.separate(type='MATERIAL')
-    objects = bpy.context.selected_objects.copy()
+    if len(disp_body.data.materials) > 1:
+        utils.edit_mode_to(disp_body)
+        bpy.ops.mesh.separate(type='MATERIAL')
+        objects = bpy.context.selected_objects.copy()
+    else:
+        # nothing to split
+        objects = [disp_body]
     for obj in objects:
         utils.set_only_render_visible(obj)
         utils.object_mode_to(obj)
@@ -172,12 +197,12 @@ def do_multires_bake(context, chr_cache, multires_mesh, layer_target, apply_shap
         utils.delete_mesh_object(obj)
 
     # Normal Baking
-    select_bake_images(multires_mesh, BAKE_TYPE_NORMALS, layer_target)
+    select_bake_images(bake_nodes, BAKE_TYPE_NORMALS, layer_target)
 
     # copy the body for normal baking
     utils.set_only_render_visible(multires_mesh)
     utils.log_info("Duplicating body for normal baking")
-    norm_body = utils.duplicate_object(multires_mesh)
+    norm_body = utils.duplicate_object_fast(multires_mesh)
     norm_body.name = multires_mesh.name + "_NORMBAKE"
     materials.normalize_udim_uvs(norm_body)
     utils.set_only_render_visible(norm_body)
@@ -231,20 +256,18 @@ def save_skin_gen_bake(chr_cache, body, layer_target):
     character_name = chr_cache.character_name
 
     if body:
+        # one image settings scene for all the saves
+        save_scene = imageutils.make_save_image_scene()
+
         for mat in body.data.materials:
 
             normal_image_name = f"{character_name}_{mat.name}_{layer_target}_{BAKE_NORMAL_SUFFIX}"
             displacement_image_name = f"{character_name}_{mat.name}_{layer_target}_{BAKE_DISPLACEMENT_SUFFIX}"
             ao_image_name = f"{character_name}_{mat.name}_{layer_target}_{BAKE_AO_SUFFIX}"
 
-            if normal_image_name in bpy.data.images:
-                normal_image = bpy.data.images[normal_image_name]
-
-            if displacement_image_name in bpy.data.images:
-                displacement_image = bpy.data.images[displacement_image_name]
-
-            if ao_image_name in bpy.data.images:
-                ao_image = bpy.data.images[ao_image_name]
+            normal_image = bpy.data.images.get(normal_image_name)
+            displacement_image = bpy.data.images.get(displacement_image_name)
+            ao_image = bpy.data.images.get(ao_image_name)
 
             images = [
                 [normal_image, normal_image_name, 'PNG', '8'],
@@ -259,41 +282,88 @@ def save_skin_gen_bake(chr_cache, body, layer_target):
                     image_path = os.path.normpath(os.path.join(bake_dir, image_file))
 
                     if image_path:
-                        imageutils.save_scene_image(image, image_path, file_format, color_depth)
+                        imageutils.save_scene_image(image, image_path, file_format, color_depth, scene=save_scene)
                         utils.log_info(f"Saved baked Image: {image_path}")
 
+        bpy.data.scenes.remove(save_scene)
 
-def select_bake_images(body, bake_type, layer_target):
+
+def get_bake_node_name(bake_type, layer_target):
+    if bake_type == BAKE_TYPE_NORMALS:
+        return f"{layer_target}_{BAKE_NORMAL_SUFFIX}"
+    elif bake_type == BAKE_TYPE_AO:
+        return f"{layer_target}_{BAKE_AO_SUFFIX}"
+    else:
+        return f"{layer_target}_{BAKE_DISPLACEMENT_SUFFIX}"
+
+
+def get_bake_nodes(body, layer_target):
+    """Finds the bake image nodes of every bake type in each material of the body, in one pass
+       over each material's nodes, deselecting all the nodes as it goes.
+       Returns a list of (material, { bake_type: node }) for select_bake_images."""
+    bake_nodes = []
     if body:
         for mat in body.data.materials:
             nodes = mat.node_tree.nodes
             for node in nodes:
                 node.select = False
+            image_nodes = nodeutils.index_nodes_by_type(nodes).get("TEX_IMAGE", [])
+            mat_bake_nodes = {}
+            for bake_type in [BAKE_TYPE_AO, BAKE_TYPE_DISPLACEMENT, BAKE_TYPE_NORMALS]:
+                bake_node_name = get_bake_node_name(bake_type, layer_target)
+                mat_bake_nodes[bake_type] = nodeutils.find_node_by_type_and_keywords(image_nodes, "TEX_IMAGE", bake_node_name)
+            bake_nodes.append((mat, mat_bake_nodes))
+    return bake_nodes
+
+
+def has_bake_images(bake_nodes, bake_type):
+    for mat, mat_bake_nodes in bake_nodes:
+        if mat_bake_nodes[bake_type]:
+            return True
+    return False
 
-            if bake_type == BAKE_TYPE_NORMALS:
-                bake_node_name = f"{layer_target}_{BAKE_NORMAL_SUFFIX}"
-            elif bake_type == BAKE_TYPE_AO:
-                bake_node_name = f"{layer_target}_{BAKE_AO_SUFFIX}"
-            else:
-                bake_node_name = f"{layer_target}_{BAKE_DISPLACEMENT_SUFFIX}"
 
-            bake_node = nodeutils.find_node_by_type_and_keywords(nodes, "TEX_IMAGE", bake_node_name)
+def select_bake_images(bake_nodes, bake_type, layer_target):
+    for mat, mat_bake_nodes in bake_nodes:
+        nodes = mat.node_tree.nodes
+        # only the bake nodes were left selected by the previous bake
+        for node in mat_bake_nodes.values():
+            if node:
+                node.select = False
+
+        bake_node = mat_bake_nodes[bake_type]
 
-            if bake_node:
-                utils.log_info(f"Selecting image {bake_node.name} for bake.")
-                bake_node.select = True
-                nodes.active = bake_node
-            else:
-                utils.log_error(f"Could not find image node: {bake_node_name}!")
+        if bake_node:
+            utils.log_info(f"Selecting image {bake_node.name} for bake.")
+            bake_node.select = True
+            nodes.active = bake_node
+        else:
+            bake_node_name = get_bake_node_name(bake_type, layer_target)
+            utils.log_error(f"Could not find image node: {bake_node_name}!")
 
 
-def has_overlay_nodes(body, layer_target):
+def get_layer_mix_node(mat, layer_target):
+    """Returns the layer mix node of the material, looked up by its last known name before scanning the nodes."""
     mix_node_name = f"{layer_target}_{LAYER_MIX_SUFFIX}"
+    nodes = mat.node_tree.nodes
+    key = (mat.name, layer_target)
+    node_name = LAYER_MIX_NODE_NAMES.get(key)
+    if node_name:
+        mix_node = nodes.get(node_name)
+        if mix_node and mix_node.type == "GROUP" and mix_node_name in mix_node.name:
+            return mix_node
+    mix_node = nodeutils.find_node_by_type_and_keywords(nodes, "GROUP", mix_node_name)
+    if mix_node:
+        LAYER_MIX_NODE_NAMES[key] = mix_node.name
+    else:
+        LAYER_MIX_NODE_NAMES.pop(key, None)
+    return mix_node
+
+
+def has_overlay_nodes(body, layer_target):
     if body:
         for mat in body.data.materials:
-            nodes = mat.node_tree.nodes
-            mix_node = nodeutils.find_node_by_type_and_keywords(nodes, "GROUP", mix_node_name)
-            if mix_node:
+            if get_layer_mix_node(mat, layer_target):
                 return True
     return False
 
@@ -347,10 +417,8 @@ def update_layer_nodes(context, chr_cache, layer_target, socket, value):
     context = vars.get_context(context)
     source_obj = utils.get_context_mesh(context)
     if chr_cache and source_obj:
-        mix_node_name = f"{layer_target}_{LAYER_MIX_SUFFIX}"
         for mat in source_obj.data.materials:
-            nodes = mat.node_tree.nodes
-            mix_node = nodeutils.find_node_by_type_and_keywords(nodes, "GROUP", mix_node_name)
+            mix_node = get_layer_mix_node(mat, layer_target)
             nodeutils.set_node_input_value(mix_node, socket, value)
 
 def get_bake_dir(chr_cache):
@@ -368,6 +436,30 @@ def setup_bake_nodes(context, chr_cache, multires_mesh, layer_target):
 
     bake_dir = get_bake_dir(chr_cache)
 
+    # the bake image sizes are the same for all the materials
+    if layer_target == LAYER_TARGET_DETAIL:
+        normal_size = int(prefs.detail_normal_bake_size)
+    else:
+        normal_size = int(prefs.body_normal_bake_size)
+    ao_size = int(0.5 * normal_size)
+
+    # the node names are the same for all the materials
+    mix_node_name = f"{layer_target}_{LAYER_MIX_SUFFIX}"
+    sculpt_mix_node_name = f"{LAYER_TARGET_SCULPT}_{LAYER_MIX_SUFFIX}"
+    detail_mix_node_name = f"{LAYER_TARGET_DETAIL}_{LAYER_MIX_SUFFIX}"
+    normal_bake_node_name = f"{layer_target}_{BAKE_NORMAL_SUFFIX}"
+    ao_bake_node_name = f"{layer_target}_{BAKE_AO_SUFFIX}"
+    displacement_bake_node_name = f"{layer_target}_{BAKE_DISPLACEMENT_SUFFIX}"
+    normal_layer_node_name = f"{layer_target}_{LAYER_NORMAL_SUFFIX}"
+    ao_layer_node_name = f"{layer_target}_{LAYER_AO_SUFFIX}"
+    displacement_layer_node_name = f"{layer_target}_{LAYER_DISPLACEMENT_SUFFIX}"
+
+    # base the image name on the character name
+    character_name = chr_cache.character_name
+
+    # the layer mix nodes are about to be rebuilt
+    LAYER_MIX_NODE_NAMES.clear()
+
     for mat in multires_mesh.data.materials:
         nodes = mat.node_tree.nodes
         links = mat.node_tree.links
@@ -378,20 +470,10 @@ def setup_bake_nodes(context, chr_cache, multires_mesh, layer_target):
         shader_name = params.get_shader_name(mat_cache)
         bsdf_node, shader_node, mixer_node = nodeutils.get_shader_nodes(mat, shader_name)
 
-        # base the image name on the character name
-        character_name = chr_cache.character_name
-        mix_node_name = f"{layer_target}_{LAYER_MIX_SUFFIX}"
-        sculpt_mix_node_name = f"{LAYER_TARGET_SCULPT}_{LAYER_MIX_SUFFIX}"
-        detail_mix_node_name = f"{LAYER_TARGET_DETAIL}_{LAYER_MIX_SUFFIX}"
-        normal_image_name = f"{character_name}_{mat.name}_{layer_target}_{BAKE_NORMAL_SUFFIX}"
-        ao_image_name = f"{character_name}_{mat.name}_{layer_target}_{BAKE_AO_SUFFIX}"
-        displacement_image_name = f"{character_name}_{mat.name}_{layer_target}_{BAKE_DISPLACEMENT_SUFFIX}"
-        normal_bake_node_name = f"{layer_target}_{BAKE_NORMAL_SUFFIX}"
-        ao_bake_node_name = f"{layer_target}_{BAKE_AO_SUFFIX}"
-        displacement_bake_node_name = f"{layer_target}_{BAKE_DISPLACEMENT_SUFFIX}"
-        normal_layer_node_name = f"{layer_target}_{LAYER_NORMAL_SUFFIX}"
-        ao_layer_node_name = f"{layer_target}_{LAYER_AO_SUFFIX}"
-        displacement_layer_node_name = f"{layer_target}_{LAYER_DISPLACEMENT_SUFFIX}"
+        image_name_prefix = f"{character_name}_{mat.name}_"
+        normal_image_name = image_name_prefix + normal_bake_node_name
+        ao_image_name = image_name_prefix + ao_bake_node_name
+        displacement_image_name = image_name_prefix + displacement_bake_node_name
         normal_image_file = normal_image_name + ".png"
         normal_image_path = os.path.normpath(os.path.join(bake_dir, normal_image_file))
         ao_image_file = ao_image_name + ".png"
@@ -403,17 +485,17 @@ def setup_bake_nodes(context, chr_cache, multires_mesh, layer_target):
         if layer_target == LAYER_TARGET_DETAIL:
             delta = 600
 
-        if layer_target == LAYER_TARGET_DETAIL:
-            normal_image = imageutils.get_custom_image(normal_image_name, int(prefs.detail_normal_bake_size), alpha = False, data = True, path = normal_image_path)
-            ao_image = imageutils.get_custom_image(ao_image_name, int(0.5 * int(prefs.detail_normal_bake_size)), alpha = False, data = True, path = ao_image_path)
-            displacement_image = imageutils.get_custom_image(displacement_image_name, int(prefs.detail_normal_bake_size), alpha = False, data = True, float = True, path = displacement_image_path)
-        else:
-            normal_image = imageutils.get_custom_image(normal_image_name, int(prefs.body_normal_bake_size), alpha = False, data = True, path = normal_image_path)
-            ao_image = imageutils.get_custom_image(ao_image_name, int(0.5 * int(prefs.body_normal_bake_size)), alpha = False, data = True, path = ao_image_path)
-            displacement_image = imageutils.get_custom_image(displacement_image_name, int(prefs.body_normal_bake_size), alpha = False, data = True, float = True, path = displacement_image_path)
-
-        normal_tex_node = nodeutils.find_node_by_type_and_keywords(nodes, "TEX_IMAGE", "(NORMAL)")
-        ao_tex_node = nodeutils.find_node_by_type_and_keywords(nodes, "TEX_IMAGE", "(AO)")
+        normal_image = imageutils.get_custom_image(normal_image_name, normal_size, alpha = False, data = True, path = normal_image_path)
+        ao_image = imageutils.get_custom_image(ao_image_name, ao_size, alpha = False, data = True, path = ao_image_path)
+        displacement_image = imageutils.get_custom_image(displacement_image_name, normal_size, alpha = False, data = True, float = True, path = displacement_image_path)
+
+        # index the nodes once for all the lookups (the other layer's mix node is only looked up
+        # to connect to it, so it must already exist and doesn't need the newly created nodes indexed)
+        node_index = nodeutils.index_nodes_by_type(nodes)
+        image_nodes = node_index.get("TEX_IMAGE", [])
+        group_nodes = node_index.get("GROUP", [])
+        normal_tex_node = nodeutils.find_node_by_type_and_keywords(image_nodes, "TEX_IMAGE", "(NORMAL)")
+        ao_tex_node = nodeutils.find_node_by_type_and_keywords(image_nodes, "TEX_IMAGE", "(AO)")
         ref_location = mathutils.Vector((-1600, -1100))
         normal_bake_node = nodeutils.create_custom_image_node(nodes, normal_bake_node_name, normal_image, location = (1000 + delta, -1000))
         ao_bake_node = nodeutils.create_custom_image_node(nodes, ao_bake_node_name, ao_image, location = (1000 + delta, -1300))
@@ -427,7 +509,7 @@ def setup_bake_nodes(context, chr_cache, multires_mesh, layer_target):
                                                      location = ref_location + mathutils.Vector((delta, -1800)))
 
         # find or create the layer mix group
-        mix_node = nodeutils.find_node_by_type_and_keywords(nodes, "GROUP", mix_node_name)
+        mix_node = nodeutils.find_node_by_type_and_keywords(group_nodes, "GROUP", mix_node_name)
         if not mix_node:
             mix_group = nodeutils.get_node_group("rl_tex_mod_normal_ao_blend")
             mix_node = nodeutils.make_node_group_node(nodes, mix_group, "Normal Blend", mix_node_name)
@@ -455,7 +537,7 @@ def setup_bake_nodes(context, chr_cache, multires_mesh, layer_target):
         mix_node.location = ref_location + mathutils.Vector((300 + delta, -1200))
 
         # if connecting the detail layer and there is also a sculpt layer, connect the normal input from the sculpt layer instead
-        sculpt_mix_node = nodeutils.find_node_by_type_and_keywords(nodes, "GROUP", sculpt_mix_node_name)
+        sculpt_mix_node = nodeutils.find_node_by_type_and_keywords(group_nodes, "GROUP", sculpt_mix_node_name)
         if layer_target == LAYER_TARGET_DETAIL and sculpt_mix_node:
             nodeutils.link_nodes(links, sculpt_mix_node, "Color", mix_node, "Color1")
             nodeutils.link_nodes(links, sculpt_mix_node, "AO", mix_node, "AO1")
@@ -468,7 +550,7 @@ def setup_bake_nodes(context, chr_cache, multires_mesh, layer_target):
         nodeutils.link_nodes(links, displacement_layer_node, "Color", mix_node, "Displacement Mask")
 
         # if connecting the sculpt layer and there is also a detail layer, connect the normal output from the sculpt layer to detail layer input
-        detail_mix_node = nodeutils.find_node_by_type_and_keywords(nodes, "GROUP", detail_mix_node_name)
+        detail_mix_node = nodeutils.find_node_by_type_and_keywords(group_nodes, "GROUP", detail_mix_node_name)
         if layer_target == LAYER_TARGET_SCULPT and detail_mix_node:
             nodeutils.link_nodes(links, mix_node, "Color", detail_mix_node, "Color1")
             nodeutils.link_nodes(links, mix_node, "AO", detail_mix_node, "AO1")
@@ -497,6 +579,9 @@ def remove_bake_nodes(context, chr_cache, layer_target, multires_mesh):
         utils.log_error("Multires mesh not found!")
         return
 
+    # the layer mix nodes are about to be removed
+    LAYER_MIX_NODE_NAMES.clear()
+
     for mat in multires_mesh.data.materials:
         nodes = mat.node_tree.nodes
         links = mat.node_tree.links
@@ -511,8 +596,12 @@ def remove_bake_nodes(context, chr_cache, layer_target, multires_mesh):
         ao_layer_node_name = f"{layer_target}_{LAYER_AO_SUFFIX}"
         displacement_layer_node_name = f"{layer_target}_{LAYER_DISPLACEMENT_SUFFIX}"
 
+        node_index = nodeutils.index_nodes_by_type(nodes)
+        image_nodes = node_index.get("TEX_IMAGE", [])
+        group_nodes = node_index.get("GROUP", [])
+
         # remove the mix layer
-        mix_node = nodeutils.find_node_by_type_and_keywords(nodes, "GROUP", mix_node_name)
+        mix_node = nodeutils.find_node_by_type_and_keywords(group_nodes, "GROUP", mix_node_name)
         normal_to_node, normal_to_socket = nodeutils.get_node_and_socket_connected_to_output(mix_node, "Color")
         normal_from_node, normal_from_socket = nodeutils.get_node_and_socket_connected_to_input(mix_node, "Color1")
         ao_to_node, ao_to_socket = nodeutils.get_node_and_socket_connected_to_output(mix_node, "AO")
@@ -529,8 +618,9 @@ def remove_bake_nodes(context, chr_cache, layer_target, multires_mesh):
         for node_name in [normal_bake_node_name, normal_layer_node_name,
                           ao_bake_node_name, ao_layer_node_name,
                           displacement_bake_node_name, displacement_layer_node_name]:
-            node = nodeutils.find_node_by_type_and_keywords(nodes, "TEX_IMAGE", node_name)
+            node = nodeutils.find_node_by_type_and_keywords(image_nodes, "TEX_IMAGE", node_name)
             if node:
+                image_nodes.remove(node)
                 nodes.remove(node)
 
 
@@ -548,8 +638,9 @@ def flatten_bake_layers(context, chr_cache):
 
             sculpt_mix_node_name = f"{LAYER_TARGET_SCULPT}_{LAYER_MIX_SUFFIX}"
             detail_mix_node_name = f"{LAYER_TARGET_DETAIL}_{LAYER_MIX_SUFFIX}"
-            sculpt_mix_node = nodeutils.find_node_by_type_and_keywords(nodes, "GROUP", sculpt_mix_node_name)
-            detail_mix_node = nodeutils.find_node_by_type_and_keywords(nodes, "GROUP", detail_mix_node_name)
+            group_nodes = nodeutils.index_nodes_by_type(nodes).get("GROUP", [])
+            sculpt_mix_node = nodeutils.find_node_by_type_and_keywords(group_nodes, "GROUP", sculpt_mix_node_name)
+            detail_mix_node = nodeutils.find_node_by_type_and_keywords(group_nodes, "GROUP", detail_mix_node_name)
             mix_node = detail_mix_node if detail_mix_node else sculpt_mix_node
 
             if mix_node:
@@ -766,74 +857,61 @@ def add_multires_mesh(context, chr_cache, layer_target, sub_target = "ALL"):
     if len(body_objects) == 1 and is_body_type:
 
         body = body_objects[0]
-        multires_mesh = utils.duplicate_object(body)
+        multires_mesh = utils.duplicate_object_fast(body)
         multires_source = body
 
-        # split the objects by material
-        utils.clear_selected_objects()
-        utils.edit_mode_to(multires_mesh)
-        bpy.ops.mesh.separate(type='MATERIAL')
-        objects = context.selected_objects.copy()
-        rejoin = []
-
         # delete the material parts not wanted by the sculpt target
-        for obj in objects:
-            if len(obj.material_slots) > 0:
-                mat = obj.material_slots[0].material
-                mat_cache = chr_cache.get_material_cache(mat)
-                remove = False
+        remove_indices = set()
+        for i, slot in enumerate(multires_mesh.material_slots):
+            mat = slot.material
+            mat_cache = chr_cache.get_material_cache(mat)
+            remove = False
 
-                if mat and mat_cache:
+            if mat and mat_cache:
 
-                    # always remove eyelashes and nails
-                    if (mat_cache.material_type == "NAILS" or
-                        mat_cache.material_type == "EYELASH"):
-                        remove = True
+                # always remove eyelashes and nails
+                if (mat_cache.material_type == "NAILS" or
+                    mat_cache.material_type == "EYELASH"):
+                    remove = True
 
-                    if sub_target == "BODY":
-                        # remove head
-                        if mat_cache.material_type == "SKIN_HEAD":
-                            remove = True
+                if sub_target == "BODY":
+                    # remove head
+                    if mat_cache.material_type == "SKIN_HEAD":
+                        remove = True
 
-                    elif sub_target == "HEAD":
-                        # remove everything but head
-                        if mat_cache.material_type != "SKIN_HEAD":
-                            remove = True
+                elif sub_target == "HEAD":
+                    # remove everything but head
+                    if mat_cache.material_type != "SKIN_HEAD":
+                        remove = True
 
-                if remove:
-                    utils.delete_mesh_object(obj)
-                else:
-                    rejoin.append(obj)
+            if remove:
+                remove_indices.add(i)
 
-        # rejoin the remaining objects
-        utils.try_select_objects(rejoin, True)
-        multires_mesh = rejoin[0]
-        utils.set_active_object(multires_mesh)
-        bpy.ops.object.join()
+        # directly from the mesh, without splitting into objects and rejoining
+        if remove_indices and utils.object_mode_to(multires_mesh):
+            geom.delete_material_faces(multires_mesh, remove_indices)
 
     else:
 
         if context_object in cache_objects:
             body = context_object
-            multires_mesh = utils.duplicate_object(body)
+            multires_mesh = utils.duplicate_object_fast(body)
             multires_source = body
 
     if multires_mesh and utils.set_only_active_object(multires_mesh):
 
-        # remove doubles
-        if utils.edit_mode_to(multires_mesh):
-            bpy.ops.mesh.select_mode(use_extend=False, use_expand=False, type='VERT')
-            bpy.ops.mesh.select_all(action='SELECT')
-            bpy.ops.mesh.remove_doubles()
-
         if utils.object_mode_to(multires_mesh):
 
             # remove all modifiers
             multires_mesh.modifiers.clear()
 
-            # remove all shapekeys
+            # remove all shapekeys (first, so the doubles aren't welded in every shape key)
             if utils.object_has_shape_keys(multires_mesh):
-                bpy.ops.object.shape_key_remove(all=True)
+                multires_mesh.shape_key_clear()
+
+            # remove doubles
+            num_removed = geom.remove_doubles(multires_mesh)
+            utils.log_info(f"Removed {num_removed} doubles")
 
             # unparent and keep transform
             #bpy.ops.object.parent_clear(type = "CLEAR_KEEP_TRANSFORM")
@@ -906,7 +984,6 @@ class CC3OperatorSculpt(bpy.types.Operator):
 
     def execute(self, context):
         props = vars.props()
-        prefs = vars.prefs()
 
         chr_cache = props.get_context_character_cache(context)
 
@@ -925,7 +1002,7 @@ class CC3OperatorSculpt(bpy.types.Operator):
         elif self.param == "DETAIL_CLEAN":
             clean_multires_sculpt(context, chr_cache, LAYER_TARGET_DETAIL)
 
-        if self.param == "BODY_SETUP":
+        elif self.param == "BODY_SETUP":
             setup_multires_sculpt(context, chr_cache, LAYER_TARGET_SCULPT)
 
         elif self.param == "BODY_BEGIN":
@@ -957,15 +1034,9 @@ class CC3OperatorSculpt(bpy.types.Operator):
     def description(cls, context, properties):
 
         if properties.param == "DETAIL_SETUP":
-            return "Set up and begin detail sculpting for the character.\n\n" \
-                   "Detail sculpting is done on a reduced copy of the character and sculpted normals are baked back and overlayed on the original character.\n\n" \
-                   "Note: This does not make any changes to the mesh of the original character.\n\n" \
-                   "Warning: It is very important that you *do not* apply the base shape yourself in the multi-res modifier"
+            return DETAIL_SETUP_DESCRIPTION
         elif properties.param == "DETAIL_BEGIN":
-            return "Resume detail sculpting for the character.\n\n" \
-                   "Detail sculpting is done on a reduced copy of the character and sculpted normals are baked back and overlayed on the original character.\n\n" \
-                   "Note: This does not make any changes to the mesh of the original character.\n\n" \
-                   "Warning: It is very important that you *do not* apply the base shape yourself in the multi-res modifier"
+            return DETAIL_BEGIN_DESCRIPTION
         elif properties.param == "DETAIL_END":
             return "Stop detail sculpting and return to the original character"
         elif properties.param == "DETAIL_BAKE":
@@ -977,15 +1048,9 @@ class CC3OperatorSculpt(bpy.types.Operator):
             return "Removes the detail sculpt and normal layers"
 
         elif properties.param == "BODY_SETUP":
-            return "Set up and begin full body sculpting for the character.\n\n" \
-                   "Body sculpting is done on a reduced copy of the character (Only the Head, Body, Arms and Legs) and sculpted normals are baked back and overlayed on the original character.\n\n" \
-                   "Note: This does not make any changes to the mesh of the original character.\n\n" \
-                   "Warning: It is very important that you *do not* apply the base shape yourself in the multi-res modifier"
+            return BODY_SETUP_DESCRIPTION
         elif properties.param == "BODY_BEGIN":
-            return "Resume full body sculpting for the character.\n\n" \
-                   "Body sculpting is done on a reduced copy of the character (Only the Head, Body, Arms and Legs) and sculpted normals are baked back and overlayed on the original character.\n\n" \
-                   "Note: This does not make any changes to the mesh of the original character.\n\n" \
-                   "Warning: It is very important that you *do not* apply the base shape yourself in the multi-res modifier"
+            return BODY_BEGIN_DESCRIPTION
         elif properties.param == "BODY_END":
             return "Stop body sculpting and return to the original character"
         elif properties.param == "BODY_BAKE":
@@ -1027,7 +1092,6 @@ class CC3OperatorSculptExport(bpy.types.Operator):
 
     def execute(self, context):
         props = vars.props()
-        prefs = vars.prefs()
 
         chr_cache = props.get_context_character_cache(context)
 
@@ -1041,10 +1105,6 @@ class CC3OperatorSculptExport(bpy.types.Operator):
 
 
     def invoke(self, context, event):
-        prefs = vars.prefs()
-        props = vars.props()
-        chr_cache = props.get_context_character_cache(context)
-
         export_format = "png"
 
         # determine default file name
@@ -1067,11 +1127,8 @@ class CC3OperatorSculptExport(bpy.types.Operator):
         change_ext = False
         filepath = self.filepath
         if os.path.basename(filepath):
-            base, ext = os.path.splitext(filepath)
-            if ext != self.filename_ext:
-                filepath = bpy.path.ensure_ext(base, self.filename_ext)
-            else:
-                filepath = bpy.path.ensure_ext(filepath, self.filename_ext)
+            base = os.path.splitext(filepath)[0]
+            filepath = bpy.path.ensure_ext(base, self.filename_ext)
             if filepath != self.filepath:
                 self.filepath = filepath
                 change_ext = True
@@ -46,17 +46,23 @@ def log_spacing():
     return " " * LOG_INDENT
 
 
-def log_detail(msg):
+def log_detail(msg, *args):
     prefs = vars.prefs()
-    """Log an info message to console."""
+    """Log an info message to console.
+       Any args are %-formatted into msg only if the message is logged."""
     if prefs.log_level == "DETAILS":
+        if args:
+            msg = msg % args
         print((" " * LOG_INDENT) + msg)
 
 
-def log_info(msg):
+def log_info(msg, *args):
     prefs = vars.prefs()
-    """Log an info message to console."""
+    """Log an info message to console.
+       Any args are %-formatted into msg only if the message is logged."""
     if prefs.log_level == "ALL" or prefs.log_level == "DETAILS":
+        if args:
+            msg = msg % args
         print((" " * LOG_INDENT) + msg)
 
 
@@ -770,6 +776,30 @@ def duplicate_object(obj, include_action=False) -> bpy.types.Object:
     return None
 
 
+def duplicate_object_fast(obj) -> bpy.types.Object:
+    """Duplicates the object and its data directly through the data API, without the
+       duplicate operator, its context setup and selection changes.
+       The duplicate is linked to the same collections as the source, without any actions."""
+    if object_exists(obj):
+        # leaving edit mode writes any pending edits back to the mesh before it is copied
+        if obj.mode != "OBJECT" and not set_mode("OBJECT"):
+            return None
+        new_obj = obj.copy()
+        if obj.data:
+            new_obj.data = obj.data.copy()
+        # (only unset the actions, as duplicate_object does, keeping any drivers)
+        safe_set_action(new_obj, None, create=False)
+        if new_obj.type == "MESH":
+            safe_set_action(new_obj.data.shape_keys, None, create=False)
+        collections = obj.users_collection
+        if not collections:
+            collections = [bpy.context.collection]
+        for collection in collections:
+            collection.objects.link(new_obj)
+        return new_obj
+    return None
+
+
 def remove_all_shape_keys(obj):
     if obj and obj.data.shape_keys and obj.data.shape_keys.key_blocks:
         keys = [key for key in obj.data.shape_keys.key_blocks]
@@ -1192,6 +1222,12 @@ def array_to_vector(arr):
     return Vector()
 
 
+def array_to_vector_scaled(arr, scale):
+    if len(arr) == 3:
+        return Vector((arr[0] * scale, arr[1] * scale, arr[2] * scale))
+    return Vector()
+
+
 def array_to_color(arr, to_srgb=False, to_linear=False):
     if len(arr) == 1:
         r = g = b = arr[0]
@@ -1681,20 +1717,16 @@ def set_only_render_visible(object):
     obj : bpy.types.Object
     for obj in bpy.data.objects:
         if object_exists(obj):
-            visible = obj.visible_get()
-            render = not obj.hide_render
-            if obj == object:
-                try:
-                    obj.hide_render = False
-                    unhide(obj)
-                except:
-                    pass
-            else:
-                try:
-                    obj.hide_render = True
-                    hide(obj)
-                except:
-                    pass
+            # only write the flags that change, every write tags the depsgraph relations for a rebuild
+            # (hidden objects are left out of the evaluation, so the bake only evaluates the object)
+            hidden = obj != object
+            try:
+                if obj.hide_render != hidden:
+                    obj.hide_render = hidden
+                if obj.hide_get() != hidden:
+                    hide(obj, hidden)
+            except:
+                pass
 
 
 def store_object_transform(obj: bpy.types.Object):
@@ -24,6 +24,7 @@ DEV = False
 PLUGIN_COMPATIBLE = [
     "2.1.11", "2.1.12", "2.2.0", "2.2.1", "2.2.2", "2.2.3", "2.2.4",
 ]
+ADDON_KEY = __name__.partition(".")[0]
 
 def set_version_string(bl_info):
     global VERSION_STRING
@@ -34,7 +35,7 @@ def set_version_string(bl_info):
         VERSION_STRING += str(v)
 
 def prefs():
-    return bpy.context.preferences.addons[__name__.partition(".")[0]].preferences
+    return bpy.context.preferences.addons[ADDON_KEY].preferences
 
 def props():
     return bpy.context.scene.CC3ImportProps